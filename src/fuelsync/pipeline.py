@@ -251,10 +251,13 @@ class FuelPipeline:
             end_date=batch_end,
         )
 
-        # Execute SOAP call and parse the XML response
+        # Execute SOAP call and stream-parse the raw bytes, so a large batch
+        # never holds the whole XML tree in memory
         raw_response: Response = self.efs_client.execute_operation(request)
         parsed_response: GetMCTransExtLocV2Response = (
-            GetMCTransExtLocV2Response.from_soap_response(raw_response.text)
+            GetMCTransExtLocV2Response.from_soap_response_streaming(
+                raw_response.content
+            )
         )
 
         if parsed_response.transaction_count > 0:
@@ -8,17 +8,27 @@ fleet card with its associated metadata (unit, driver, policy, status, etc.).
 """
 
 import logging
+from collections import Counter
+from collections.abc import Callable, Iterable
+from operator import attrgetter
 from typing import Any, Self
 
 import pandas as pd
+import pyarrow as pa
 from lxml import etree  # pyright: ignore[reportAttributeAccessIssue]
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from fuelsync.utils import (
+    XP_RESULT_VALUES,
+    LazyXmlSnippet,
     check_for_soap_fault,
     extract_soap_body,
+    find_soap_result,
+    intern_optional_str,
+    iter_soap_result_values,
     parse_soap_response,
     parse_xml_to_dict,
+    rows_to_columns,
 )
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -27,16 +37,16 @@ logger: logging.Logger = logging.getLogger(__name__)
 # --- Module-level constants ---
 
 # Valid card status values per EFS API documentation
-VALID_CARD_STATUSES: set[str] = {'ACTIVE', 'HOLD', 'FRAUD', 'INACTIVE'}
+VALID_CARD_STATUSES: frozenset[str] = frozenset({'ACTIVE', 'HOLD', 'FRAUD', 'INACTIVE'})
 
 # Valid payroll status values
-VALID_PAYROLL_STATUSES: set[str] = {'ACTIVE', 'INACTIVE', 'FOLLOWS'}
+VALID_PAYROLL_STATUSES: frozenset[str] = frozenset({'ACTIVE', 'INACTIVE', 'FOLLOWS'})
 
 # Valid payroll use flags
-VALID_PAYROLL_USE: set[str] = {'B', 'P', 'N'}
+VALID_PAYROLL_USE: frozenset[str] = frozenset({'B', 'P', 'N'})
 
 # Valid infosrc values (where prompt infos are defined)
-VALID_INFOSRC: set[str] = {'POLICY', 'CARD', 'BOTH'}
+VALID_INFOSRC: frozenset[str] = frozenset({'POLICY', 'CARD', 'BOTH'})
 
 # Mapping of model field names to DataFrame column names
 CARD_FIELD_MAP: dict[str, str] = {
@@ -59,6 +69,43 @@ CARD_FIELD_MAP: dict[str, str] = {
     'card_subfleet': 'card_subfleet',
 }
 
+# Reads every mapped field of a card in one C-level call, in map order
+_get_card_values: Callable[[Any], tuple[Any, ...]] = attrgetter(*CARD_FIELD_MAP)
+
+# Column dtypes for an empty to_dataframe(), matching what pandas infers for
+# populated frames (required int/bool fields never hold None)
+CARD_EMPTY_DTYPES: dict[str, Any] = dict.fromkeys(CARD_FIELD_MAP.values(), str) | {
+    'policy_number': 'int64',
+    'override': 'int64',
+    'being_overridden': 'bool',
+}
+
+# Arrow type for low-cardinality code columns (statuses, flags)
+_CODE_ARROW_TYPE: pa.DataType = pa.dictionary(pa.int8(), pa.string())
+
+# Column types for to_arrow(), in CARD_FIELD_MAP order
+CARD_ARROW_SCHEMA: pa.Schema = pa.schema(
+    [
+        ('card_number', pa.string()),
+        ('policy_number', pa.int8()),
+        ('company_xref', pa.string()),
+        ('unit_number', pa.string()),
+        ('driver_id', pa.string()),
+        ('driver_name', pa.string()),
+        ('override', pa.int8()),
+        ('being_overridden', pa.bool_()),
+        ('status', _CODE_ARROW_TYPE),
+        ('payroll_status', _CODE_ARROW_TYPE),
+        ('payroll_use', _CODE_ARROW_TYPE),
+        ('gpsid', pa.string()),
+        ('vin', pa.string()),
+        ('zid', pa.string()),
+        ('infosrc', _CODE_ARROW_TYPE),
+        ('policy_subfleet', pa.string()),
+        ('card_subfleet', pa.string()),
+    ]
+)
+
 
 class WSCardSummary(BaseModel):
     """
@@ -77,7 +124,7 @@ class WSCardSummary(BaseModel):
         driver_name: The driver name assigned to the card.
         override: Override flag (0 = no override, 1 = has override).
         being_overridden: Whether the card is currently being overridden.
-        status: Card status (Active, Hold, Fraud, Inactive).
+        status: Card status (ACTIVE, HOLD, FRAUD, INACTIVE).
         payroll_status: Payroll status for SmartFunds/Universal cards
                        (Active, Inactive, Follows).
         payroll_use: Payroll usage type (B/P/N).
@@ -152,7 +199,7 @@ class WSCardSummary(BaseModel):
         ...,
         alias='status',
         max_length=8,
-        description='Card status: Active, Hold, Fraud, or Inactive',
+        description='Card status: ACTIVE, HOLD, FRAUD, or INACTIVE',
     )
 
     payroll_status: str = Field(
@@ -211,51 +258,13 @@ class WSCardSummary(BaseModel):
         description='Subfleet ID assigned to the card',
     )
 
-    @field_validator('status')
+    @field_validator(
+        'status', 'payroll_status', 'payroll_use', 'infosrc', mode='before'
+    )
     @classmethod
-    def validate_status(cls, value: str) -> str:
-        """
-        Validate that card status is one of the known valid values.
-
-        Args:
-            value: The status string to validate.
-
-        Returns:
-            The validated status value.
-
-        Raises:
-            ValueError: If status is not in VALID_CARD_STATUSES.
-        """
-        if value.upper() not in VALID_CARD_STATUSES:
-            logger.warning(
-                'Unexpected card status %r. Expected one of %r',
-                value,
-                VALID_CARD_STATUSES,
-            )
-        return value
-
-    @field_validator('payroll_status')
-    @classmethod
-    def validate_payroll_status(cls, value: str) -> str:
-        """
-        Validate that payroll status is one of the known valid values.
-
-        Args:
-            value: The payroll status string to validate.
-
-        Returns:
-            The validated payroll status value.
-
-        Raises:
-            ValueError: If payroll status is not in VALID_PAYROLL_STATUSES.
-        """
-        if value.upper() not in VALID_PAYROLL_STATUSES:
-            logger.warning(
-                'Unexpected payroll status %r. Expected one of %r',
-                value,
-                VALID_PAYROLL_STATUSES,
-            )
-        return value
+    def _intern_codes(cls, raw_value: Any) -> Any:
+        # A handful of distinct codes repeat on every card; share one str each
+        return intern_optional_str(raw_value)
 
     @classmethod
     def from_xml_element(cls, element: etree.Element) -> Self:
@@ -287,6 +296,70 @@ class WSCardSummary(BaseModel):
         )
 
 
+def _parse_card_elements(
+    card_elements: Iterable[etree.Element],
+) -> list[WSCardSummary]:
+    """
+    Parse card <value> elements, skipping (and logging) any that fail.
+
+    Args:
+        card_elements: Card <value> elements, as a list or a stream.
+
+    Returns:
+        The successfully parsed card summaries, in document order.
+    """
+    cards: list[WSCardSummary] = []
+
+    for card_elem in card_elements:
+        try:
+            cards.append(WSCardSummary.from_xml_element(card_elem))
+        except Exception as e:
+            # Log the error and the specific XML that failed
+            logger.error(
+                'Failed to parse card summary <value> element: %r\n'
+                '--- Failing XML Snippet ---\n%s\n'
+                '--- End Snippet ---',
+                e,
+                LazyXmlSnippet(card_elem),
+            )
+            # Continue parsing other cards rather than failing entirely
+
+    return cards
+
+
+def _warn_unexpected_statuses(cards: list[WSCardSummary]) -> None:
+    """
+    Log one warning per status field that has values outside the known set.
+
+    Checked once per response rather than per card, so a new status code from
+    the API produces a single summary line instead of one warning per card.
+
+    Args:
+        cards: Parsed card summaries.
+    """
+    unexpected_statuses: Counter[str] = Counter(
+        card.status for card in cards if card.status.upper() not in VALID_CARD_STATUSES
+    )
+    if unexpected_statuses:
+        logger.warning(
+            'Unexpected card status values (value: count) %r. Expected one of %r',
+            dict(unexpected_statuses),
+            VALID_CARD_STATUSES,
+        )
+
+    unexpected_payroll_statuses: Counter[str] = Counter(
+        card.payroll_status
+        for card in cards
+        if card.payroll_status.upper() not in VALID_PAYROLL_STATUSES
+    )
+    if unexpected_payroll_statuses:
+        logger.warning(
+            'Unexpected payroll status values (value: count) %r. Expected one of %r',
+            dict(unexpected_payroll_statuses),
+            VALID_PAYROLL_STATUSES,
+        )
+
+
 class GetCardSummariesResponse(BaseModel):
     """
     Response model for getCardSummaries operation.
@@ -320,25 +393,23 @@ class GetCardSummariesResponse(BaseModel):
 
         Example:
             >>> response = GetCardSummariesResponse.from_soap_response(xml)
-            >>> active_cards = [c for c in response.cards if c.status == 'Active']
+            >>> active_cards = [c for c in response.cards if c.status == 'ACTIVE']
         """
         logger.debug('Parsing SOAP response for GetCardSummariesResponse')
 
         # Parse and validate SOAP envelope
         root: etree.Element = parse_soap_response(xml_string)
-        check_for_soap_fault(root)
         body: etree.Element = extract_soap_body(root)
-
-        cards: list[WSCardSummary] = []
+        check_for_soap_fault(body)
 
         # Find the result element containing card data
-        result_element: etree.Element | None = body.find('.//result')
+        result_element: etree.Element | None = find_soap_result(body)
         if result_element is None:
             logger.warning('No <result> element found in response body.')
             return cls(cards=[])
 
         # Get all card value elements
-        card_elements: list[etree.Element] = result_element.findall('./value')
+        card_elements: list[etree.Element] = XP_RESULT_VALUES(result_element)
 
         if not card_elements:
             logger.warning('No <value> elements found in response body.')
@@ -346,26 +417,44 @@ class GetCardSummariesResponse(BaseModel):
 
         logger.info('Found %d card summary elements to parse.', len(card_elements))
 
-        # Parse each card element, continuing on individual failures
-        for card_elem in card_elements:
-            try:
-                cards.append(WSCardSummary.from_xml_element(card_elem))
-            except Exception as e:
-                # Log the error and the specific XML that failed
-                failed_xml: str = etree.tostring(
-                    card_elem, pretty_print=True, encoding='unicode'
-                )
-                logger.error(
-                    'Failed to parse card summary <value> element: %r\n'
-                    '--- Failing XML Snippet ---\n%s\n'
-                    '--- End Snippet ---',
-                    e,
-                    failed_xml,
-                )
-                # Continue parsing other cards rather than failing entirely
+        cards: list[WSCardSummary] = _parse_card_elements(card_elements)
+        _warn_unexpected_statuses(cards)
 
         logger.info('Successfully parsed %d card summaries.', len(cards))
-        return cls(cards=cards)
+        # Cards were validated individually above; skip re-walking the list
+        return cls.model_construct(cards=cards)
+
+    @classmethod
+    def from_soap_response_streaming(cls, xml_bytes: bytes) -> Self:
+        """
+        Parse card summaries from raw response bytes, one card at a time.
+
+        Produces the same cards (and the same status warnings) as
+        from_soap_response. Each card <value> is validated as soon as its end
+        tag is read and then dropped from the tree, which matters for fleets
+        with thousands of cards.
+
+        Args:
+            xml_bytes: The raw XML response from the SOAP API, as bytes
+                (e.g. requests.Response.content).
+
+        Returns:
+            A GetCardSummariesResponse with all parsed card summaries.
+
+        Raises:
+            RuntimeError: If the response contains a SOAP Fault.
+            ValueError: If the response has no SOAP Body.
+            etree.XMLSyntaxError: If the XML is malformed.
+        """
+        logger.debug('Streaming SOAP response for GetCardSummariesResponse')
+
+        cards: list[WSCardSummary] = _parse_card_elements(
+            iter_soap_result_values(xml_bytes)
+        )
+        _warn_unexpected_statuses(cards)
+
+        logger.info('Successfully parsed %d card summaries.', len(cards))
+        return cls.model_construct(cards=cards)
 
     def to_dataframe(self) -> pd.DataFrame:
         """
@@ -378,23 +467,46 @@ class GetCardSummariesResponse(BaseModel):
         Example:
             >>> response = GetCardSummariesResponse.from_soap_response(xml)
             >>> df = response.to_dataframe()
-            >>> active_units = df[df['status'] == 'Active']['unit_number'].unique()
+            >>> active_units = df[df['status'] == 'ACTIVE']['unit_number'].unique()
             >>> print(df[['card_number', 'unit_number', 'driver_name', 'status']])
         """
         if not self.cards:
-            # Return empty DataFrame with proper schema
-            return pd.DataFrame(columns=list(CARD_FIELD_MAP.values()))
+            # Return empty DataFrame with the dtypes a populated one gets
+            return pd.DataFrame(
+                {
+                    col_name: pd.Series(dtype=dtype)
+                    for col_name, dtype in CARD_EMPTY_DTYPES.items()
+                }
+            )
+
+        # Build one list per column (structure-of-arrays) rather than one dict
+        # per card
+        return pd.DataFrame(
+            rows_to_columns(map(_get_card_values, self.cards), CARD_FIELD_MAP.values()),
+            copy=False,
+        )
 
-        # Convert all cards to dictionaries using field mapping
-        rows: list[dict[str, Any]] = []
-        for card in self.cards:
-            row: dict[str, Any] = {
-                col_name: getattr(card, field_name)
-                for field_name, col_name in CARD_FIELD_MAP.items()
-            }
-            rows.append(row)
+    def to_arrow(self) -> pa.Table:
+        """
+        Convert card summaries to a pyarrow Table.
+
+        Types come from CARD_ARROW_SCHEMA. The four code columns (status,
+        payroll_status, payroll_use, infosrc) are dictionary-encoded, since a
+        handful of codes repeat on every card; policy_number and override are
+        stored as int8.
 
-        return pd.DataFrame(rows)
+        Returns:
+            Table with one row per card, in CARD_FIELD_MAP column order.
+
+        Example:
+            >>> response = GetCardSummariesResponse.from_soap_response(xml)
+            >>> table = response.to_arrow()
+            >>> print(table.schema)
+        """
+        return pa.Table.from_pydict(
+            rows_to_columns(map(_get_card_values, self.cards), CARD_FIELD_MAP.values()),
+            schema=CARD_ARROW_SCHEMA,
+        )
 
     @property
     def card_count(self) -> int:
@@ -409,12 +521,14 @@ class GetCardSummariesResponse(BaseModel):
     @property
     def active_card_count(self) -> int:
         """
-        Number of cards with 'Active' status.
+        Number of cards with ACTIVE status.
+
+        Compared case-insensitively, like the status check at parse time.
 
         Returns:
             Count of active cards.
         """
-        return sum(1 for card in self.cards if card.status == 'Active')
+        return sum(1 for card in self.cards if card.status.upper() == 'ACTIVE')
 
     @property
     def unit_numbers(self) -> list[str]:
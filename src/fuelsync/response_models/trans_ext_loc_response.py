@@ -9,36 +9,54 @@ type-safe Python objects.
 # pyright: reportUnknownVariableType=false
 
 import logging
-import re
-from datetime import datetime
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime, timedelta
+from operator import attrgetter
 from typing import Any, Self
 
+import numpy as np
 import pandas as pd
 from lxml import etree
 
 # from lxml import ET
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
+from pydantic.dataclasses import dataclass
 
 # Import your robust parser utilities
 from fuelsync.utils import (
+    XP_RESULT_VALUES,
+    LazyXmlSnippet,
     check_for_soap_fault,
     extract_soap_body,
+    find_soap_result,
+    intern_optional_str,
+    iter_soap_result_values,
     parse_soap_response,
     parse_xml_to_dict,
+    rows_to_columns,
 )
 
 logger: logging.Logger = logging.getLogger(__name__)
 
 
 # --- Module-level constants ---
-# Wex sends the string 'null'
-_NULL_TOKEN_PATTERN: re.Pattern[str] = re.compile(
-    r'^\s*(?:null|add\s*value)?\s*$',
-    re.IGNORECASE,
-)
+# Wex marks missing values with placeholders like 'null' or 'add value'. Both
+# start with one of these letters, so _is_null_token rejects anything else on
+# its first character without lowercasing or scanning the rest.
+_NULL_TOKEN_INITIALS: frozenset[str] = frozenset('nNaA')
 
 DATETIME_COLUMNS: list[str] = ['transaction_date', 'pos_date']
 
+# Integer datetime encoding for to_dataframe(); NaT is int64 min in numpy
+_EPOCH: datetime = datetime(1970, 1, 1, tzinfo=UTC)
+_ONE_MICROSECOND: timedelta = timedelta(microseconds=1)
+_NAT_EPOCH_MICROS: int = int(np.iinfo(np.int64).min)
+
+# Unit pandas itself infers for datetime objects: 'us' on pandas 3, 'ns' on
+# pandas 2. Datetime columns are cast to it so the schema matches the
+# installed pandas rather than this module's microsecond encoding.
+_DATETIME_UNIT: str = pd.DatetimeIndex([_EPOCH]).unit
+
 FLOAT64_COLUMNS: list[str] = [
     'location_latitude',
     'location_longitude',
@@ -94,6 +112,13 @@ STRING_COLUMNS: list[str] = [
     'region',
 ]
 
+# Schema dtype per column, so to_dataframe() can build typed arrays directly
+_COLUMN_DTYPES: dict[str, pd.api.extensions.ExtensionDtype] = {
+    **dict.fromkeys(FLOAT64_COLUMNS, pd.Float64Dtype()),
+    **dict.fromkeys(INT64_COLUMNS, pd.Int64Dtype()),
+    **dict.fromkeys(STRING_COLUMNS, pd.StringDtype()),
+}
+
 
 # Define fuel type mapping once at the top of the file, after imports
 FUEL_TYPE_MAP: dict[int, str] = {
@@ -117,6 +142,14 @@ FUEL_TYPE_MAP: dict[int, str] = {
     16777216: 'LNG',
 }
 
+# Fuel type codes are single-bit flags, so a code's bit position indexes this
+# dense lookup table (unused positions stay None).
+_FUEL_TYPE_LUT: np.ndarray = np.full(
+    max(FUEL_TYPE_MAP).bit_length(), None, dtype=object
+)
+for _fuel_code, _fuel_name in FUEL_TYPE_MAP.items():
+    _FUEL_TYPE_LUT[_fuel_code.bit_length() - 1] = _fuel_name
+
 # Info fields we want to extract from the infos array
 INFO_FIELDS: list[str] = [
     'UNIT',
@@ -173,6 +206,22 @@ INFO_FIELD_MAP: dict[str, str] = {
     'DMLC': 'region',
 }
 
+# Info columns by coercion; see ExtractedInfoFields
+INFO_INT_FIELDS: tuple[str, ...] = (
+    'odometer',
+    'class_code',
+    'branch_code',
+    'business_id',
+    'driver_id',
+)
+INFO_STRING_FIELDS: tuple[str, ...] = (
+    'unit',
+    'vehicle_type',
+    'driver_name',
+    'gl_code',
+    'region',
+)
+
 LINE_ITEM_FIELD_MAP: dict[str, str] = {
     'line_number': 'line_number',
     'category': 'category',
@@ -186,8 +235,77 @@ LINE_ITEM_FIELD_MAP: dict[str, str] = {
     'disc_amount': 'line_disc_amount',
 }
 
+# Field/column name tuples in map order, for positional row building
+TRANSACTION_FIELDS: tuple[str, ...] = tuple(TRANSACTION_FIELD_MAP)
+TRANSACTION_COLUMNS: tuple[str, ...] = tuple(TRANSACTION_FIELD_MAP.values())
+LINE_ITEM_FIELDS: tuple[str, ...] = tuple(LINE_ITEM_FIELD_MAP)
+LINE_ITEM_COLUMNS: tuple[str, ...] = tuple(LINE_ITEM_FIELD_MAP.values())
+
+# Per-line-item columns derived from line_taxes
+LINE_ITEM_DERIVED_COLUMNS: tuple[str, ...] = (
+    'fed_tax',
+    'state_fuel_tax',
+    'total_line_tax',
+)
+
+# Canonical to_dataframe() column order
+ALL_COLUMNS: tuple[str, ...] = (
+    *TRANSACTION_COLUMNS,
+    *INFO_FIELD_MAP.values(),
+    'line_item_count',
+    *LINE_ITEM_COLUMNS,
+    'fuel_type_name',
+    *LINE_ITEM_DERIVED_COLUMNS,
+)
+
+# Positional getters for to_dataframe() rows (one C-level call per record)
+_get_transaction_values: Callable[[Any], tuple[Any, ...]] = attrgetter(
+    *TRANSACTION_FIELDS
+)
+_get_line_item_values: Callable[[Any], tuple[Any, ...]] = attrgetter(*LINE_ITEM_FIELDS)
+_EMPTY_LINE_ITEM_ROW: tuple[None, ...] = (None,) * (
+    len(LINE_ITEM_FIELDS) + len(LINE_ITEM_DERIVED_COLUMNS)
+)
+
+
+# Nested records (line items, infos, taxes, metadata, fleet memos, CARMS
+# statements) are created by the thousand per response. Slotted frozen
+# pydantic dataclasses keep validation and aliases but store each instance in
+# a fraction of the memory of a BaseModel.
+_LEAF_MODEL_CONFIG: ConfigDict = ConfigDict(populate_by_name=True)
+
 
 # --- Utility Functions ---
+def _is_null_token(raw_value: str) -> bool:
+    """
+    Check whether a string is one of Wex's null placeholders.
+
+    Matches blank strings, 'null' and 'add value' (with any inner spacing,
+    or none), in any case and with surrounding whitespace.
+
+    Args:
+        raw_value: Incoming raw string from the API.
+
+    Returns:
+        True if the string stands for a missing value.
+    """
+    stripped: str = raw_value.strip()
+    if not stripped:
+        return True
+    if stripped[0] not in _NULL_TOKEN_INITIALS:
+        return False
+    lowered: str = stripped.lower()
+    if lowered == 'null':
+        return True
+    # 'add', optional whitespace, 'value'
+    return (
+        lowered.startswith('add')
+        and lowered.endswith('value')
+        and len(lowered) >= len('addvalue')
+        and not lowered[3:-5].strip()
+    )
+
+
 def _normalize_null_like_value(raw_value: Any) -> Any:
     """
     Normalize common null-like API values.
@@ -205,14 +323,200 @@ def _normalize_null_like_value(raw_value: Any) -> Any:
     """
     if raw_value is None:
         return None
-    if isinstance(raw_value, str) and _NULL_TOKEN_PATTERN.match(raw_value):
+    if isinstance(raw_value, str) and _is_null_token(raw_value):
         return None
     return raw_value
 
 
+def _normalize_optional_str(raw_value: Any) -> str | None:
+    """
+    Normalize an incoming value to a stripped string, or None if null-like.
+
+    Args:
+        raw_value: Raw value from API.
+
+    Returns:
+        The stripped string, or None.
+    """
+    normalized: Any = _normalize_null_like_value(raw_value)
+    if normalized is None:
+        return None
+    return str(normalized).strip() or None
+
+
+def _int_from_str(raw_value: str) -> int | None:
+    """
+    Coerce a string from the API to an int.
+
+    Args:
+        raw_value: Raw string value, possibly padded or a null token.
+
+    Returns:
+        The parsed int, or None for null tokens and non-numeric strings
+        (the latter logged as a warning).
+    """
+    if _is_null_token(raw_value):
+        return None
+    # int() tolerates surrounding whitespace itself
+    try:
+        return int(raw_value)
+    except ValueError:
+        logger.warning('Expected numeric string but got %r. Returning None', raw_value)
+        return None
+
+
+def _int_from_float(raw_value: float) -> int | None:
+    """
+    Coerce a float to an int when it holds a whole number.
+
+    Args:
+        raw_value: Raw float value.
+
+    Returns:
+        The int value, or None (with a warning) if the float has a
+        fractional part.
+    """
+    if raw_value.is_integer():
+        return int(raw_value)
+    logger.warning(
+        'Expected int but got non-integer float (%r). Returning None', raw_value
+    )
+    return None
+
+
+def _int_from_bool(raw_value: bool) -> None:
+    """
+    Reject a bool where an int is expected.
+
+    Args:
+        raw_value: Raw bool value.
+
+    Returns:
+        Always None, after logging a warning.
+    """
+    logger.warning('Expected int but got bool (%r). Returning None', raw_value)
+
+
+def _int_from_unsupported(raw_value: Any) -> None:
+    """
+    Reject a value of a type with no int coercion.
+
+    Args:
+        raw_value: Raw value of any other type.
+
+    Returns:
+        Always None, after logging a warning.
+    """
+    logger.warning(
+        'Unsupported type for int coercion: %s (Value: %r)',
+        type(raw_value).__name__,
+        raw_value,
+    )
+
+
+def _float_from_str(raw_value: str) -> float | None:
+    """
+    Coerce a string from the API to a float.
+
+    Args:
+        raw_value: Raw string value, possibly padded or a null token.
+
+    Returns:
+        The parsed float, or None for null tokens and non-numeric strings
+        (the latter logged as a warning).
+    """
+    if _is_null_token(raw_value):
+        return None
+    try:
+        return float(raw_value)
+    except ValueError:
+        logger.warning(
+            'Expected float but got non-numeric string %r. Returning None', raw_value
+        )
+        return None
+
+
+def _float_from_bool(raw_value: bool) -> None:
+    """
+    Reject a bool where a float is expected.
+
+    Args:
+        raw_value: Raw bool value.
+
+    Returns:
+        Always None, after logging a warning.
+    """
+    logger.warning('Expected float but got bool (%r). Returning None', raw_value)
+
+
+def _float_from_unsupported(raw_value: Any) -> None:
+    """
+    Reject a value of a type with no float coercion.
+
+    Args:
+        raw_value: Raw value of any other type.
+
+    Returns:
+        Always None, after logging a warning.
+    """
+    logger.warning(
+        'Unsupported type for float coercion: %s (Value: %r)',
+        type(raw_value).__name__,
+        raw_value,
+    )
+
+
+# Coercers keyed on the exact input type. bool precedes int so the isinstance
+# fallback (used for subclasses) checks it first.
+_INT_COERCERS: dict[type, Callable[[Any], int | None]] = {
+    str: _int_from_str,
+    type(None): lambda _raw_value: None,
+    bool: _int_from_bool,
+    int: lambda raw_value: raw_value,
+    float: _int_from_float,
+}
+
+_FLOAT_COERCERS: dict[type, Callable[[Any], float | None]] = {
+    str: _float_from_str,
+    type(None): lambda _raw_value: None,
+    bool: _float_from_bool,
+    int: float,
+    float: float,
+}
+
+
+def _lookup_coercer(
+    coercers: dict[type, Callable[[Any], Any]],
+    raw_value: Any,
+    unsupported: Callable[[Any], None],
+) -> Callable[[Any], Any]:
+    """
+    Find the coercer for a value's type, falling back to isinstance order.
+
+    Args:
+        coercers: Coercer table keyed on exact type.
+        raw_value: The value to coerce.
+        unsupported: Coercer used when no table entry applies.
+
+    Returns:
+        The coercer to call with raw_value.
+    """
+    coercer: Callable[[Any], Any] | None = coercers.get(type(raw_value))
+    if coercer is not None:
+        return coercer
+    return next(
+        (
+            candidate
+            for value_type, candidate in coercers.items()
+            if isinstance(raw_value, value_type)
+        ),
+        unsupported,
+    )
+
+
 def _coerce_optional_int(raw_value: Any) -> int | None:
     """
-    Coerce an incoming value to an optional int using structural pattern matching.
+    Coerce an incoming value to an optional int via a type-keyed coercer table.
 
     Accepts strings like '047078' and returns 47078. Treats null-like tokens as None.
     Explicitly rejects booleans and non-integer floats to prevent data silent corruption.
@@ -226,92 +530,192 @@ def _coerce_optional_int(raw_value: Any) -> int | None:
     Side Effects:
         Emits a logger.warning for inputs that are not null-like but fail coercion.
     """
-    normalized_value: Any = _normalize_null_like_value(raw_value)
-    result: int | None = None
+    return _lookup_coercer(_INT_COERCERS, raw_value, _int_from_unsupported)(raw_value)
 
-    match normalized_value:
-        case None:
-            result = None
 
-        case bool():
-            logger.warning(
-                'Expected int but got bool (%r). Returning None', normalized_value
-            )
-            result = None
+def _coerce_optional_float(raw_value: Any) -> float | None:
+    """
+    Coerce an incoming value to an optional float via a type-keyed coercer table.
 
-        case int():
-            result = normalized_value
+    Treats null-like tokens as None.
 
-        case float() if normalized_value.is_integer():
-            result = int(normalized_value)
+    Args:
+        raw_value: Raw value from API.
 
-        case float():
-            logger.warning(
-                'Expected int but got non-integer float (%r). Returning None',
-                normalized_value,
-            )
-            result = None
-
-        case str():
-            stripped_value: str = normalized_value.strip()
-            try:
-                result = int(stripped_value)
-            except ValueError:
-                logger.warning(
-                    'Expected numeric string but got %r. Returning None',
-                    normalized_value,
+    Returns:
+        Parsed float, or None.
+
+    Side Effects:
+        Emits logger.warning on invalid, non-missing inputs.
+    """
+    return _lookup_coercer(_FLOAT_COERCERS, raw_value, _float_from_unsupported)(
+        raw_value
+    )
+
+
+def _decode_fuel_types(fuel_type_codes: pd.Series) -> np.ndarray:
+    """
+    Decode fuel type bit-flag codes to names in one vectorized lookup.
+
+    Args:
+        fuel_type_codes: Int64 Series of fuel type codes (may contain NA).
+
+    Returns:
+        Object array of fuel type names, None where the code is missing or
+        not a known single-bit fuel type.
+    """
+    codes: np.ndarray = fuel_type_codes.to_numpy(dtype=np.int64, na_value=0)
+    is_known_flag: np.ndarray = (
+        (codes > 0)
+        & ((codes & (codes - 1)) == 0)
+        & (codes < (1 << len(_FUEL_TYPE_LUT)))
+    )
+
+    bit_positions: np.ndarray = np.zeros(len(codes), dtype=np.intp)
+    bit_positions[is_known_flag] = np.log2(codes[is_known_flag]).astype(np.intp)
+
+    fuel_type_names: np.ndarray = _FUEL_TYPE_LUT[bit_positions]
+    fuel_type_names[~is_known_flag] = None
+    return fuel_type_names
+
+
+def _to_utc(raw_value: Any) -> Any:
+    """
+    Normalize a datetime to UTC so a column shares a single tzinfo.
+
+    pandas converts same-tz datetimes on its fast path; the mixed UTC offsets
+    the API returns force per-value conversion. Naive datetimes are treated as
+    UTC, matching pd.to_datetime(utc=True).
+
+    Args:
+        raw_value: Cell value from a datetime column.
+
+    Returns:
+        The value as an aware UTC datetime, or unchanged if not a datetime.
+    """
+    if not isinstance(raw_value, datetime):
+        return raw_value
+    if raw_value.tzinfo is None:
+        return raw_value.replace(tzinfo=UTC)
+    return raw_value.astimezone(UTC)
+
+
+def _datetime_column(values: list[Any]) -> pd.DatetimeIndex:
+    """
+    Convert a column of parsed datetimes to a UTC DatetimeIndex.
+
+    Pydantic already produced datetime objects, so there is nothing to parse:
+    each value becomes its integer microseconds since the epoch and the
+    array is viewed as datetime64[us] in one step. Columns holding anything
+    else (e.g. strings from model_construct) fall back to pd.to_datetime.
+
+    Args:
+        values: Column values (datetimes or None).
+
+    Returns:
+        A UTC datetime index in _DATETIME_UNIT, with NaT for missing values.
+    """
+    try:
+        epoch_micros: np.ndarray = np.array(
+            [
+                _NAT_EPOCH_MICROS
+                if value is None
+                else (
+                    (value if value.tzinfo is not None else value.replace(tzinfo=UTC))
+                    - _EPOCH
                 )
-                result = None
+                // _ONE_MICROSECOND
+                for value in values
+            ],
+            dtype=np.int64,
+        )
+    except (AttributeError, TypeError):
+        return pd.to_datetime(
+            [_to_utc(value) for value in values],
+            utc=True,
+            format='ISO8601',
+            cache=True,
+        ).as_unit(_DATETIME_UNIT)
+    return (
+        pd.DatetimeIndex(epoch_micros.view('datetime64[us]'))
+        .tz_localize(UTC)
+        .as_unit(_DATETIME_UNIT)
+    )
 
-        case _:
-            logger.warning(
-                'Unsupported type for int coercion: %s (Value: %r)',
-                type(normalized_value).__name__,
-                normalized_value,
-            )
-            result = None
 
-    return result  # Fallback, should not reach here due to logging above
+def _typed_column(column_name: str, values: list[Any]) -> Any:
+    """
+    Build a column directly as its schema extension array.
 
+    Skips pandas' object-dtype inference and the later to_numeric/astype pass.
+    Values the strict constructor rejects (e.g. non-numeric strings) are
+    returned as-is for _coerce_dataframe_schema's tolerant coercion.
 
-def _coerce_optional_float(raw_value: Any) -> float | None:
+    Args:
+        column_name: Output column name.
+        values: Column values (None for missing).
+
+    Returns:
+        A typed pandas array, or the original list if the column has no
+        schema dtype or cannot be converted strictly.
     """
-    Coerce an incoming value to an optional float.
+    dtype: pd.api.extensions.ExtensionDtype | None = _COLUMN_DTYPES.get(column_name)
+    if dtype is None:
+        return values
+    try:
+        return pd.array(values, dtype=dtype)
+    except (TypeError, ValueError):
+        return values
 
-    Treats null-like tokens as None.
+
+def _repeat_rows(values: Any, row_positions: np.ndarray) -> Any:
+    """
+    Expand a per-transaction column to one entry per output row.
 
     Args:
-        raw_value: Raw value from API.
+        values: Typed pandas array, or a plain list left for pandas inference.
+        row_positions: Source transaction index for each output row.
 
     Returns:
-        Parsed float, or None.
+        An array with one value per output row.
+    """
+    if isinstance(values, list):
+        if not values:
+            return values
+        # Infer the dtype the DataFrame constructor would have chosen
+        values = pd.Series(values).array
+    return values.take(row_positions)
 
-    Side Effects:
-        Emits logger.warning on invalid, non-missing inputs.
+
+def _needs_coercion(
+    dataframe: pd.DataFrame, column_name: str, dtype: pd.api.extensions.ExtensionDtype
+) -> bool:
     """
-    normalized_value: Any = _normalize_null_like_value(raw_value)
-    if normalized_value is None:
-        return None
+    Check whether a present column still needs converting to a schema dtype.
 
-    if isinstance(normalized_value, bool):
-        logger.warning('Expected float but got bool. Returning None')
-        return None
+    Args:
+        dataframe: DataFrame being coerced.
+        column_name: Column to check.
+        dtype: Target schema dtype.
 
-    if isinstance(normalized_value, (int, float)):
-        return float(normalized_value)
+    Returns:
+        True if the column exists and is not already of the target dtype.
+    """
+    return column_name in dataframe.columns and dataframe[column_name].dtype != dtype
 
-    if isinstance(normalized_value, str):
-        stripped_value: str = normalized_value.strip()
-        try:
-            return float(stripped_value)
-        except ValueError:
-            logger.warning('Expected float but got non-numeric string. Returning None')
-            return None
 
-    logger.warning(
-        'Unsupported type for float coercion: %r', type(normalized_value).__name__
-    )
-    return None  # Fallback, should not reach here due to logging above
+def _is_utc_datetime(column: pd.Series) -> bool:
+    """
+    Check whether a column is already a UTC datetime column.
+
+    Args:
+        column: Column to check.
+
+    Returns:
+        True if the column has a tz-aware datetime dtype in UTC.
+    """
+    dtype: Any = column.dtype
+    return isinstance(dtype, pd.DatetimeTZDtype) and str(dtype.tz) == 'UTC'
 
 
 def _coerce_dataframe_schema(transaction_dataframe: pd.DataFrame) -> pd.DataFrame:
@@ -330,29 +734,32 @@ def _coerce_dataframe_schema(transaction_dataframe: pd.DataFrame) -> pd.DataFram
     Raises:
         None. (Uses safe coercion; unexpected values become missing.)
     """
-    coerced_dataframe: pd.DataFrame = transaction_dataframe.copy()
+    # Shallow copy: columns are replaced, never modified in place
+    coerced_dataframe: pd.DataFrame = transaction_dataframe.copy(deep=False)
 
     # Apply datetime conversion to columns
     for column_name in DATETIME_COLUMNS:
-        if column_name in coerced_dataframe.columns:
+        if column_name in coerced_dataframe.columns and not _is_utc_datetime(
+            coerced_dataframe[column_name]
+        ):
             coerced_dataframe[column_name] = pd.to_datetime(
                 coerced_dataframe[column_name], utc=True
             )
 
     for column_name in FLOAT64_COLUMNS:
-        if column_name in coerced_dataframe.columns:
+        if _needs_coercion(coerced_dataframe, column_name, pd.Float64Dtype()):
             coerced_dataframe[column_name] = pd.to_numeric(
                 coerced_dataframe[column_name], errors='coerce'
             ).astype(pd.Float64Dtype())
 
     for column_name in INT64_COLUMNS:
-        if column_name in coerced_dataframe.columns:
+        if _needs_coercion(coerced_dataframe, column_name, pd.Int64Dtype()):
             coerced_dataframe[column_name] = pd.to_numeric(
                 coerced_dataframe[column_name], errors='coerce'
             ).astype(pd.Int64Dtype())
 
     for column_name in STRING_COLUMNS:
-        if column_name in coerced_dataframe.columns:
+        if _needs_coercion(coerced_dataframe, column_name, pd.StringDtype()):
             coerced_dataframe[column_name] = coerced_dataframe[column_name].astype(
                 pd.StringDtype()
             )
@@ -363,7 +770,8 @@ def _coerce_dataframe_schema(transaction_dataframe: pd.DataFrame) -> pd.DataFram
 # --- Nested Response Models ---
 
 
-class WSTransactionCarmsStmt(BaseModel):
+@dataclass(slots=True, frozen=True, config=_LEAF_MODEL_CONFIG)
+class WSTransactionCarmsStmt:
     """
     CARMS statement data.
 
@@ -371,15 +779,14 @@ class WSTransactionCarmsStmt(BaseModel):
     and Management System) transaction.
     """
 
-    model_config = ConfigDict(populate_by_name=True)
-
     statement_id: str | None = Field(None, alias='statementId')
 
     def __repr__(self) -> str:
         return f'WSTransactionCarmsStmt(statement_id={self.statement_id})'
 
 
-class WSFleetMemo(BaseModel):
+@dataclass(slots=True, frozen=True, config=_LEAF_MODEL_CONFIG)
+class WSFleetMemo:
     """
     Fleet memo associated with a transaction.
 
@@ -387,8 +794,6 @@ class WSFleetMemo(BaseModel):
     merchant information, ATM details, and posting amounts.
     """
 
-    model_config = ConfigDict(populate_by_name=True)
-
     card_number: str | None = Field(None, alias='cardNumber')
     acceptor_name: str | None = Field(None, alias='acceptorName')
     auth_code: str | None = Field(None, alias='authCode')
@@ -424,7 +829,8 @@ class WSFleetMemo(BaseModel):
         )
 
 
-class WSTransactionInfo(BaseModel):
+@dataclass(slots=True, frozen=True, config=_LEAF_MODEL_CONFIG)
+class WSTransactionInfo:
     """
     Represents a simple key-value pair for transaction info.
 
@@ -432,11 +838,14 @@ class WSTransactionInfo(BaseModel):
         <infos><type>UNIT</type><value>404706</value></infos>
     """
 
-    model_config = ConfigDict(populate_by_name=True)
-
     info_type: str | None = Field(None, alias='type')
     info_value: str | None = Field(None, alias='value')
 
+    @field_validator('info_type', mode='before')
+    @classmethod
+    def _intern_codes(cls, raw_value: Any) -> Any:
+        return intern_optional_str(raw_value)
+
     def __repr__(self) -> str:
         return f'WSTransactionInfo(type={self.info_type}, value={self.info_value})'
 
@@ -462,27 +871,15 @@ class ExtractedInfoFields(BaseModel):
     driver_id: int | None = None
     region: str | None = None
 
-    @field_validator(
-        'odometer',
-        'class_code',
-        'branch_code',
-        'business_id',
-        'driver_id',
-        mode='before',
-    )
+    @field_validator(*INFO_INT_FIELDS, mode='before')
     @classmethod
     def _coerce_int_fields(cls, raw_value: Any) -> int | None:
         return _coerce_optional_int(raw_value)
 
-    @field_validator(
-        'unit', 'vehicle_type', 'driver_name', 'gl_code', 'region', mode='before'
-    )
+    @field_validator(*INFO_STRING_FIELDS, mode='before')
     @classmethod
     def _normalize_string_fields(cls, raw_value: Any) -> str | None:
-        normalized: Any = _normalize_null_like_value(raw_value)
-        if normalized is None:
-            return None
-        return str(normalized).strip() or None
+        return _normalize_optional_str(raw_value)
 
     @classmethod
     def from_info_list(cls, infos: list[WSTransactionInfo]) -> Self:
@@ -519,7 +916,8 @@ class ExtractedInfoFields(BaseModel):
         return cls.model_validate(field_data)
 
 
-class WSTransTaxes(BaseModel):
+@dataclass(slots=True, frozen=True, config=_LEAF_MODEL_CONFIG)
+class WSTransTaxes:
     """
     Represents a single tax line item within a main line item.
 
@@ -532,8 +930,6 @@ class WSTransTaxes(BaseModel):
         </lineTaxes>
     """
 
-    model_config = ConfigDict(populate_by_name=True)
-
     tax_description: str | None = Field(None, alias='taxDescription')
     gross_net_flag: str | None = Field(None, alias='grossNetFlag')
     amount: float | None = Field(None, alias='amount')
@@ -542,11 +938,17 @@ class WSTransTaxes(BaseModel):
     pst_exempt_adjust: float | None = Field(None, alias='pstExemptAdjust')
     gst_exempt_adjust: float | None = Field(None, alias='gstExemptAdjust')
 
+    @field_validator('tax_description', 'tax_code', mode='before')
+    @classmethod
+    def _intern_codes(cls, raw_value: Any) -> Any:
+        return intern_optional_str(raw_value)
+
     def __repr__(self) -> str:
         return f'WSTransTaxes(description={self.tax_description}, amount={self.amount})'
 
 
-class WSTransactionLineItemExt(BaseModel):
+@dataclass(slots=True, frozen=True, config=_LEAF_MODEL_CONFIG)
+class WSTransactionLineItemExt:
     """
     Represents a single line item (e.g., ULSD fuel, DEF fluid).
 
@@ -559,8 +961,6 @@ class WSTransactionLineItemExt(BaseModel):
         </lineItems>
     """
 
-    model_config = ConfigDict(populate_by_name=True)
-
     amount: float | None = Field(None, alias='amount')
     billing_flag: int | None = Field(None, alias='billingFlag')
     category: str | None = Field(None, alias='category')
@@ -597,6 +997,11 @@ class WSTransactionLineItemExt(BaseModel):
     def _coerce_int(cls, raw_value: Any) -> int | None:
         return _coerce_optional_int(raw_value)
 
+    @field_validator('category', 'group_category', mode='before')
+    @classmethod
+    def _intern_codes(cls, raw_value: Any) -> Any:
+        return intern_optional_str(raw_value)
+
     def __repr__(self) -> str:
         return (
             f'WSTransactionLineItemExt('
@@ -606,7 +1011,8 @@ class WSTransactionLineItemExt(BaseModel):
         )
 
 
-class WSMetaData(BaseModel):
+@dataclass(slots=True, frozen=True, config=_LEAF_MODEL_CONFIG)
+class WSMetaData:
     """
     Represents a metadata key-value pair.
 
@@ -618,8 +1024,6 @@ class WSMetaData(BaseModel):
         </metaData>
     """
 
-    model_config = ConfigDict(populate_by_name=True)
-
     type_id: str | None = Field(None, alias='typeId')
     meta_data: str | None = Field(None, alias='metaData')
     description: str | None = Field(None, alias='description')
@@ -739,6 +1143,13 @@ class WSMCTransExtLocV2(BaseModel):
     def _coerce_int(cls, raw_value: Any) -> int | None:
         return _coerce_optional_int(raw_value)
 
+    @field_validator(
+        'billing_currency', 'location_currency', 'location_state', mode='before'
+    )
+    @classmethod
+    def _intern_codes(cls, raw_value: Any) -> Any:
+        return intern_optional_str(raw_value)
+
     @classmethod
     def from_xml_element(cls, element: etree.Element) -> Self:
         """
@@ -772,6 +1183,82 @@ class WSMCTransExtLocV2(BaseModel):
 # --- Response Container ---
 
 
+def _parse_transaction_elements(
+    value_elements: Iterable[etree.Element],
+) -> list[WSMCTransExtLocV2]:
+    """
+    Parse transaction <value> elements, skipping (and logging) any that fail.
+
+    Args:
+        value_elements: Transaction <value> elements, as a list or a stream.
+
+    Returns:
+        The successfully parsed transactions, in document order.
+    """
+    transactions: list[WSMCTransExtLocV2] = []
+
+    for trans_elem in value_elements:
+        try:
+            transactions.append(WSMCTransExtLocV2.from_xml_element(trans_elem))
+        except Exception as e:
+            # Log the error and the specific XML that failed
+            logger.error(
+                'Failed to parse one transaction <value> element: %r\n'
+                '--- Failing XML Snippet ---\n%s\n'
+                '--- End Snippet ---',
+                e,
+                LazyXmlSnippet(trans_elem),
+            )
+            # Continue parsing other transactions
+
+    return transactions
+
+
+def _pivot_info_columns(
+    transactions: list[WSMCTransExtLocV2],
+) -> dict[str, list[Any]]:
+    """
+    Pivot each transaction's infos into typed per-transaction info columns.
+
+    Applies the same coercion as ExtractedInfoFields.from_info_list, but one
+    dict lookup per info and one coercion pass per column instead of a model
+    validation per transaction.
+
+    Args:
+        transactions: Parsed transactions.
+
+    Returns:
+        Column name -> one coerced value per transaction, for every
+        INFO_FIELD_MAP column.
+    """
+    transaction_count: int = len(transactions)
+    raw_columns: dict[str, list[Any]] = {
+        col_name: [None] * transaction_count for col_name in INFO_FIELD_MAP.values()
+    }
+    columns_by_code: dict[str, list[Any]] = {
+        info_code: raw_columns[col_name]
+        for info_code, col_name in INFO_FIELD_MAP.items()
+    }
+
+    for index, transaction in enumerate(transactions):
+        for info in transaction.infos:
+            # Later duplicates win, as in from_info_list
+            column: list[Any] | None = columns_by_code.get(info.info_type)  # pyright: ignore[reportArgumentType]
+            if column is not None:
+                column[index] = info.info_value
+
+    for col_name in INFO_INT_FIELDS:
+        raw_columns[col_name] = [
+            _coerce_optional_int(value) for value in raw_columns[col_name]
+        ]
+    for col_name in INFO_STRING_FIELDS:
+        raw_columns[col_name] = [
+            _normalize_optional_str(value) for value in raw_columns[col_name]
+        ]
+
+    return raw_columns
+
+
 class GetMCTransExtLocV2Response(BaseModel):
     """
     Response model for getMCTransExtLocV2 operation.
@@ -802,24 +1289,24 @@ class GetMCTransExtLocV2Response(BaseModel):
         # 1. Parse string to XML
         root: etree.Element = parse_soap_response(xml_string)
 
-        # 2. Check for SOAP:Fault
-        check_for_soap_fault(root)
-
-        # 3. Get the <soap:Body>
+        # 2. Get the <soap:Body>
         body: etree.Element = extract_soap_body(root)
 
+        # 3. Check for SOAP:Fault (a direct child of Body)
+        check_for_soap_fault(body)
+
         # 4. Find all transaction elements and parse them
-        transactions: list[WSMCTransExtLocV2] = []
+        transactions: list[WSMCTransExtLocV2]
 
         # Based on the XML structure, the repeating transaction element is <value>
         # First find the result element, then get its direct value children
-        result_element: etree.Element | None = body.find('.//result')
+        result_element: etree.Element | None = find_soap_result(body)
         if result_element is None:
             logger.warning('No <result> element found in the response body.')
             return cls(transactions=[])
 
         # Get only the direct children named 'value'
-        result_elements: list[etree.Element] = result_element.findall('./value')
+        result_elements: list[etree.Element] = XP_RESULT_VALUES(result_element)
 
         if not result_elements:
             logger.warning('No <value> elements found in the response body.')
@@ -828,25 +1315,45 @@ class GetMCTransExtLocV2Response(BaseModel):
 
         logger.info('Found %d <value> elements to parse.', len(result_elements))
 
-        for trans_elem in result_elements:
-            try:
-                transactions.append(WSMCTransExtLocV2.from_xml_element(trans_elem))
-            except Exception as e:
-                # Log the error and the specific XML that failed
-                failed_xml = etree.tostring(
-                    trans_elem, pretty_print=True, encoding='unicode'
-                )
-                logger.error(
-                    'Failed to parse one transaction <value> element: %r\n'
-                    '--- Failing XML Snippet ---\n%s\n'
-                    '--- End Snippet ---',
-                    e,
-                    failed_xml,
-                )
-                # Continue parsing other transactions
+        transactions = _parse_transaction_elements(result_elements)
 
         logger.info('Successfully parsed %d transactions.', len(transactions))
-        return cls(transactions=transactions)
+        # Each transaction was already validated by from_xml_element, so skip
+        # re-checking the list when wrapping it in the container.
+        return cls.model_construct(transactions=transactions)
+
+    @classmethod
+    def from_soap_response_streaming(
+        cls, xml_bytes: bytes
+    ) -> 'GetMCTransExtLocV2Response':
+        """
+        Parse transactions from raw response bytes, one transaction at a time.
+
+        Produces the same transactions as from_soap_response. Each transaction
+        <value> (with its line items, taxes and infos) is validated as soon as
+        its end tag is read and then dropped from the tree, so a multi-day
+        batch never holds the whole document. The pipeline uses this path.
+
+        Args:
+            xml_bytes: The raw XML response from the SOAP API, as bytes
+                (e.g. requests.Response.content).
+
+        Returns:
+            A GetMCTransExtLocV2Response with all parsed transactions.
+
+        Raises:
+            RuntimeError: If the response contains a SOAP Fault.
+            ValueError: If the response has no SOAP Body.
+            etree.XMLSyntaxError: If the XML is malformed.
+        """
+        logger.debug('Streaming SOAP response for GetMCTransExtLocV2Response')
+
+        transactions: list[WSMCTransExtLocV2] = _parse_transaction_elements(
+            iter_soap_result_values(xml_bytes)
+        )
+
+        logger.info('Successfully parsed %d transactions.', len(transactions))
+        return cls.model_construct(transactions=transactions)
 
     def to_dataframe(self) -> pd.DataFrame:
         """
@@ -866,80 +1373,101 @@ class GetMCTransExtLocV2Response(BaseModel):
             >>> fuel_only = df[df['use_type'] == 1]  # Filter to fuel purchases
             >>> print(df[['transaction_id', 'unit', 'category', 'quantity']])
         """
-        rows: list[dict[str, Any]] = []
+        # Collect one value tuple per transaction and per line item (a C-level
+        # attrgetter call plus derived values), then transpose the tuples into
+        # column lists. Transaction columns are typed once per transaction and
+        # expanded to line-item rows with a single take over row_positions;
+        # fuel_type_name is decoded from the finished fuel_type column.
+        transaction_rows: list[tuple[Any, ...]] = []
+        line_item_rows: list[tuple[Any, ...]] = []
+        rows_per_transaction: list[int] = []
 
         for t in self.transactions:
-            # Build transaction-level data once
-            trans_data: dict[str, Any] = {
-                col_name: getattr(t, field_name)
-                for field_name, col_name in TRANSACTION_FIELD_MAP.items()
-            }
-
-            # Extract and type-coerce info fields via Pydantic model
-            extracted_info: ExtractedInfoFields = ExtractedInfoFields.from_info_list(
-                t.infos
-            )
-            trans_data.update(extracted_info.model_dump())
-
-            # Add line item count
-            trans_data['line_item_count'] = len(t.line_items)
-
-            # If no line items, create single row with None for line item fields
-            if not t.line_items:
-                row: dict[str, Any] = trans_data.copy()
-                row.update(dict.fromkeys(LINE_ITEM_FIELD_MAP.values()))
-                row.update(
-                    {
-                        'fuel_type_name': None,
-                        'fed_tax': None,
-                        'state_fuel_tax': None,
-                        'total_line_tax': None,
-                    }
-                )
-                rows.append(row)
-            else:
-                # Create one row per line item
-                for line_item in t.line_items:
-                    row = trans_data.copy()
-
-                    # Add line item fields
-                    row.update(
-                        {
-                            col_name: getattr(line_item, field_name)
-                            for field_name, col_name in LINE_ITEM_FIELD_MAP.items()
-                        }
+            line_items: list[WSTransactionLineItemExt] = t.line_items
+            transaction_rows.append((*_get_transaction_values(t), len(line_items)))
+
+            # If no line items, emit a single row with None for line item fields
+            if not line_items:
+                rows_per_transaction.append(1)
+                line_item_rows.append(_EMPTY_LINE_ITEM_ROW)
+                continue
+
+            # Emit one row per line item
+            rows_per_transaction.append(len(line_items))
+            for line_item in line_items:
+                # Extract tax information
+                fed_tax: float | None = None
+                state_fuel_tax: float | None = None
+                total_line_tax: float = 0.0
+
+                for tax in line_item.line_taxes:
+                    if tax.amount:
+                        total_line_tax += tax.amount
+                    if tax.tax_code == 'FED':
+                        fed_tax = tax.amount
+                    elif tax.tax_code == 'SFTX':
+                        state_fuel_tax = tax.amount
+
+                line_item_rows.append(
+                    (
+                        *_get_line_item_values(line_item),
+                        fed_tax,
+                        state_fuel_tax,
+                        total_line_tax if total_line_tax > 0 else None,
                     )
+                )
 
-                    # Extract tax information
-                    fed_tax: float | None = None
-                    state_fuel_tax: float | None = None
-                    total_line_tax: float = 0.0
-
-                    for tax in line_item.line_taxes:
-                        if tax.amount:
-                            total_line_tax += tax.amount
-                        if tax.tax_code == 'FED':
-                            fed_tax = tax.amount
-                        elif tax.tax_code == 'SFTX':
-                            state_fuel_tax = tax.amount
-
-                    row['fed_tax'] = fed_tax
-                    row['state_fuel_tax'] = state_fuel_tax
-                    row['total_line_tax'] = (
-                        total_line_tax if total_line_tax > 0 else None
-                    )
+        transaction_columns: dict[str, list[Any]] = rows_to_columns(
+            transaction_rows, (*TRANSACTION_COLUMNS, 'line_item_count')
+        )
+        # Typed info fields, one value per transaction
+        transaction_columns.update(_pivot_info_columns(self.transactions))
+        line_item_columns: dict[str, list[Any]] = rows_to_columns(
+            line_item_rows, (*LINE_ITEM_COLUMNS, *LINE_ITEM_DERIVED_COLUMNS)
+        )
 
-                    rows.append(row)
+        # Row i of the output belongs to transaction row_positions[i]
+        row_positions: np.ndarray = np.repeat(
+            np.arange(len(rows_per_transaction), dtype=np.intp),
+            np.asarray(rows_per_transaction, dtype=np.intp),
+        )
 
-        # Build DataFrame
-        df = pd.DataFrame(rows)
+        # Convert datetime columns in one batch while they are still plain lists,
+        # so the DataFrame constructor does not infer them value by value
+        typed_columns: dict[str, Any] = {
+            col_name: _datetime_column(transaction_columns.pop(col_name)).take(
+                row_positions
+            )
+            for col_name in DATETIME_COLUMNS
+        }
+        typed_columns.update(
+            (col_name, _repeat_rows(_typed_column(col_name, values), row_positions))
+            for col_name, values in transaction_columns.items()
+        )
+        typed_columns.update(
+            (col_name, _typed_column(col_name, values))
+            for col_name, values in line_item_columns.items()
+        )
 
-        # Apply fuel type name mapping to column
-        if 'fuel_type' in df.columns:
-            df['fuel_type_name'] = df['fuel_type'].map(FUEL_TYPE_MAP)
+        # Build DataFrame from typed column arrays in canonical column order
+        df: pd.DataFrame = pd.DataFrame(
+            {
+                col_name: typed_columns[col_name]
+                for col_name in ALL_COLUMNS
+                if col_name != 'fuel_type_name'
+            },
+            copy=False,
+        )
 
         # Normalize DataFrame schema to canonical FuelSync types
-        df: pd.DataFrame = _coerce_dataframe_schema(df)
+        df = _coerce_dataframe_schema(df)
+
+        # Decode fuel type flags to readable names
+        df.insert(
+            ALL_COLUMNS.index('fuel_type_name'),
+            'fuel_type_name',
+            pd.array(_decode_fuel_types(df['fuel_type']), dtype=pd.StringDtype()),
+        )
 
         return df
 
@@ -7,25 +7,63 @@ with details about why each transaction was rejected.
 """
 
 import logging
+from collections.abc import Callable, Iterable
 from datetime import datetime
+from operator import attrgetter
 from typing import Any, Self
 
 import pandas as pd
-from lxml import (
-    etree,
-)
+import pyarrow as pa
 from lxml.etree import Element
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 from ..utils import (
+    XP_RESULT_VALUES,
+    LazyXmlSnippet,
     check_for_soap_fault,
     extract_soap_body,
+    find_soap_result,
+    iter_soap_result_values,
     parse_soap_response,
     parse_xml_to_dict,
+    rows_to_columns,
 )
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Mapping of model field names to DataFrame column names
+REJECT_FIELD_MAP: dict[str, str] = {
+    'tran_date': 'tran_date',
+    'card_num': 'card_num',
+    'invoice': 'invoice',
+    'loc_id': 'loc_id',
+    'loc_name': 'loc_name',
+    'loc_city': 'loc_city',
+    'loc_state': 'loc_state',
+    'error_code': 'error_code',
+    'error_desc': 'error_desc',
+    'unit': 'unit',
+}
+
+# Reads every mapped field of a reject in one C-level call, in map order
+_get_reject_values: Callable[[Any], tuple[Any, ...]] = attrgetter(*REJECT_FIELD_MAP)
+
+# Column types for to_arrow(), in REJECT_FIELD_MAP order
+REJECT_ARROW_SCHEMA: pa.Schema = pa.schema(
+    [
+        ('tran_date', pa.timestamp('us', tz='UTC')),
+        ('card_num', pa.string()),
+        ('invoice', pa.string()),
+        ('loc_id', pa.int64()),
+        ('loc_name', pa.string()),
+        ('loc_city', pa.string()),
+        ('loc_state', pa.string()),
+        ('error_code', pa.int64()),
+        ('error_desc', pa.string()),
+        ('unit', pa.string()),
+    ]
+)
+
 
 class WSTranReject(BaseModel):
     """
@@ -89,6 +127,35 @@ class WSTranReject(BaseModel):
         )
 
 
+def _parse_reject_elements(reject_elements: Iterable[Element]) -> list[WSTranReject]:
+    """
+    Parse reject <value> elements, skipping (and logging) any that fail.
+
+    Args:
+        reject_elements: Reject <value> elements, as a list or a stream.
+
+    Returns:
+        The successfully parsed rejects, in document order.
+    """
+    rejects: list[WSTranReject] = []
+
+    for reject_elem in reject_elements:
+        try:
+            rejects.append(WSTranReject.from_xml_element(reject_elem))
+        except Exception as e:
+            # Log the error and the specific XML that failed
+            logger.error(
+                'Failed to parse one reject <value> element: %r\n'
+                '--- Failing XML Snippet ---\n%s\n'
+                '--- End Snippet ---',
+                e,
+                LazyXmlSnippet(reject_elem),
+            )
+            # Continue parsing other rejects
+
+    return rejects
+
+
 class GetTranRejectsResponse(BaseModel):
     """
     Response model for getTranRejects operation.
@@ -138,17 +205,21 @@ class GetTranRejectsResponse(BaseModel):
         # 1. Parse string to XML
         root: Element = parse_soap_response(xml_string)
 
-        # 2. Check for SOAP:Fault
-        check_for_soap_fault(root)
-
-        # 3. Get the <soap:Body>
+        # 2. Get the <soap:Body>
         body: Element = extract_soap_body(root)
 
+        # 3. Check for SOAP:Fault (a direct child of Body)
+        check_for_soap_fault(body)
+
         # 4. Find all rejected transaction elements
-        rejects: list[WSTranReject] = []
+        # Based on the schema, the repeating element is <value> under <result>,
+        # the same records from_soap_response_streaming yields
+        result_element: Element | None = find_soap_result(body)
+        if result_element is None:
+            logger.warning('No <result> element found in the response body.')
+            return cls(rejects=[])
 
-        # Based on the schema, the repeating element is <value>
-        result_elements: list[Element] = body.findall('.//value')
+        result_elements: list[Element] = XP_RESULT_VALUES(result_element)
 
         if not result_elements:
             logger.warning('No <value> elements found in the response body.')
@@ -157,25 +228,41 @@ class GetTranRejectsResponse(BaseModel):
 
         logger.info('Found %d <value> elements to parse.', len(result_elements))
 
-        for reject_elem in result_elements:
-            try:
-                rejects.append(WSTranReject.from_xml_element(reject_elem))
-            except Exception as e:
-                # Log the error and the specific XML that failed
-                failed_xml: str = etree.tostring(
-                    reject_elem, pretty_print=True, encoding='unicode'
-                )
-                logger.error(
-                    'Failed to parse one reject <value> element: %r\n'
-                    '--- Failing XML Snippet ---\n%r\n'
-                    '--- End Snippet ---',
-                    e,
-                    failed_xml,
-                )
-                # Continue parsing other rejects
+        rejects: list[WSTranReject] = _parse_reject_elements(result_elements)
+
+        logger.info('Successfully parsed %d rejected transactions.', len(rejects))
+        # Rejects were validated individually above; skip re-walking the list
+        return cls.model_construct(rejects=rejects)
+
+    @classmethod
+    def from_soap_response_streaming(cls, xml_bytes: bytes) -> Self:
+        """
+        Parse rejected transactions from raw response bytes, one at a time.
+
+        Produces the same rejects as from_soap_response, including skipping
+        and logging any reject that fails validation. Each reject <value> is
+        dropped from the tree once parsed.
+
+        Args:
+            xml_bytes: The raw XML response from the SOAP API, as bytes
+                (e.g. requests.Response.content).
+
+        Returns:
+            A GetTranRejectsResponse with all parsed rejected transactions.
+
+        Raises:
+            RuntimeError: If the response contains a SOAP Fault.
+            ValueError: If the response has no SOAP Body.
+            etree.XMLSyntaxError: If the XML is malformed.
+        """
+        logger.debug('Streaming SOAP response for GetTranRejectsResponse')
+
+        rejects: list[WSTranReject] = _parse_reject_elements(
+            iter_soap_result_values(xml_bytes)
+        )
 
         logger.info('Successfully parsed %d rejected transactions.', len(rejects))
-        return cls(rejects=rejects)
+        return cls.model_construct(rejects=rejects)
 
     def to_dataframe(self) -> pd.DataFrame:
         """
@@ -192,22 +279,41 @@ class GetTranRejectsResponse(BaseModel):
             >>> df = response.to_dataframe()
             >>> print(df[['card_num', 'error_desc', 'loc_name']])
         """
+        if not self.rejects:
+            # Return empty DataFrame with proper schema
+            return pd.DataFrame(columns=list(REJECT_FIELD_MAP.values()))
+
+        # Build one list per column (structure-of-arrays) rather than one dict
+        # per reject
         return pd.DataFrame(
-            [
-                {
-                    'tran_date': r.tran_date,
-                    'card_num': r.card_num,
-                    'invoice': r.invoice,
-                    'loc_id': r.loc_id,
-                    'loc_name': r.loc_name,
-                    'loc_city': r.loc_city,
-                    'loc_state': r.loc_state,
-                    'error_code': r.error_code,
-                    'error_desc': r.error_desc,
-                    'unit': r.unit,
-                }
-                for r in self.rejects
-            ]
+            rows_to_columns(
+                map(_get_reject_values, self.rejects), REJECT_FIELD_MAP.values()
+            ),
+            copy=False,
+        )
+
+    def to_arrow(self) -> pa.Table:
+        """
+        Convert rejected transactions to a pyarrow Table.
+
+        Types come from REJECT_ARROW_SCHEMA: tran_date becomes a UTC
+        microsecond timestamp and loc_id / error_code become int64, so error
+        codes can be grouped without the pandas object columns to_dataframe
+        produces.
+
+        Returns:
+            Table with one row per reject, in REJECT_FIELD_MAP column order.
+
+        Example:
+            >>> response = GetTranRejectsResponse.from_soap_response(xml)
+            >>> table = response.to_arrow()
+            >>> print(table.schema)
+        """
+        return pa.Table.from_pydict(
+            rows_to_columns(
+                map(_get_reject_values, self.rejects), REJECT_FIELD_MAP.values()
+            ),
+            schema=REJECT_ARROW_SCHEMA,
         )
 
     @property
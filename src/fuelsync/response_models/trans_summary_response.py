@@ -7,60 +7,120 @@ count and total amount for a given date range.
 """
 
 import logging
-from typing import Any
+from typing import Any, Self
 
 from lxml import etree
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from pydantic.dataclasses import dataclass
 
 from fuelsync.utils import (
+    LazyXmlSnippet,
     check_for_soap_fault,
     extract_soap_body,
+    find_soap_result,
     parse_soap_response,
     parse_xml_to_dict,
+    stream_soap_result,
 )
 
 logger: logging.Logger = logging.getLogger(__name__)
 
 
-class WSTransSummary(BaseModel):
+@dataclass(slots=True, frozen=True, config=ConfigDict(populate_by_name=True))
+class WSTransSummary:
     """
     Transaction summary containing count and total amount.
 
     This is the response for the transSummary operation, providing
-    aggregate statistics for transactions in a date range.
+    aggregate statistics for transactions in a date range. A slotted frozen
+    Pydantic dataclass: fields are still validated and coerced, without the
+    BaseModel bookkeeping for what is a two-field record.
+
+    Note:
+        Not a BaseModel, so there is no model_validate/model_dump/model_copy;
+        use WSTransSummary(...), dataclasses.asdict() and dataclasses.replace()
+        (or pydantic.TypeAdapter(WSTransSummary)) instead.
 
     Attributes:
         tran_count: Number of transactions in the period.
         tran_total: Total dollar amount across all transactions.
     """
 
-    model_config = ConfigDict(populate_by_name=True)
-
     tran_count: int | None = Field(None, alias='tranCount')
     tran_total: float | None = Field(None, alias='tranTotal')
 
     @classmethod
     def from_xml_element(cls, element: etree.Element) -> 'WSTransSummary':
         """
-        Parse a <value> XML element into a WSMCTransExtLocV2 instance.
+        Parse the <result> XML element into a WSTransSummary instance.
+
+        Uses the generic parse_xml_to_dict utility to map the tranCount and
+        tranTotal tags to fields, then validates them through the dataclass.
 
-        Uses the generic parse_xml_to_dict utility which automatically handles:
-        - Simple fields (via Pydantic field aliases)
-        - Nested single models (WSFleetMemo)
-        - Nested list models (lineItems, infos, etc.)
+        Args:
+            element: The <result> element of a transSummary response.
+
+        Returns:
+            The validated summary.
+
+        Raises:
+            ValueError: If the parsed values fail validation.
         """
         # Extract raw data from XML using introspection
         data: dict[str, Any] = parse_xml_to_dict(element, cls)
 
         try:
             # Validate and convert types using Pydantic
-            return cls.model_validate(data)
+            return cls(**data)
         except ValidationError as e:
             logger.error('Failed to validate parsed XML data: %r\nData: %r', e, data)
-            raise ValueError(f'Pydantic validation failed for transaction: {e}') from e
+            raise ValueError(f'Pydantic validation failed for summary: {e}') from e
 
     def __repr__(self) -> str:
-        return f'WSTransSummary(count={self.tran_count}, total=${self.tran_total:.2f})'
+        return f'WSTransSummary({_format_counts(self)})'
+
+
+def _format_counts(summary: WSTransSummary) -> str:
+    """
+    Format a summary's count and total for repr, tolerating missing values.
+
+    Args:
+        summary: The summary to describe.
+
+    Returns:
+        Text like 'count=3, total=$12.50'; a missing total shows as None.
+    """
+    total: str = 'None' if summary.tran_total is None else f'${summary.tran_total:.2f}'
+    return f'count={summary.tran_count}, total={total}'
+
+
+def _parse_summary_element(result_element: etree.Element) -> WSTransSummary:
+    """
+    Parse the <result> element of a transSummary response.
+
+    Args:
+        result_element: The <result> element holding the summary fields.
+
+    Returns:
+        The validated summary.
+
+    Raises:
+        ValueError: If the summary fails validation; the XML is logged.
+    """
+    try:
+        summary: WSTransSummary = WSTransSummary.from_xml_element(result_element)
+    except Exception as e:
+        logger.error(
+            'Failed to parse summary element: %r\n'
+            '--- Failing XML Snippet ---\n%s\n'
+            '--- End Snippet ---',
+            e,
+            LazyXmlSnippet(result_element),
+        )
+        raise ValueError(f'Failed to parse transaction summary: {e}') from e
+
+    logger.info('Successfully parsed summary: %r', summary)
+    return summary
 
 
 class TransSummaryResponse(BaseModel):
@@ -108,14 +168,14 @@ class TransSummaryResponse(BaseModel):
         # 1. Parse string to XML
         root: etree.Element = parse_soap_response(xml_string)
 
-        # 2. Check for SOAP:Fault
-        check_for_soap_fault(root)
-
-        # 3. Get the <soap:Body>
+        # 2. Get the <soap:Body>
         body: etree.Element = extract_soap_body(root)
 
+        # 3. Check for SOAP:Fault (a direct child of Body)
+        check_for_soap_fault(body)
+
         # 4. Find the <result> element containing the summary
-        result_element: etree.Element | None = body.find('.//result')
+        result_element: etree.Element | None = find_soap_result(body)
 
         if result_element is None:
             logger.warning('No <result> element found in the response body.')
@@ -123,32 +183,41 @@ class TransSummaryResponse(BaseModel):
 
         logger.info('Found <result> element, parsing summary.')
 
-        try:
-            summary: WSTransSummary = WSTransSummary.from_xml_element(result_element)
-            logger.info(
-                'Successfully parsed summary: %d transactions, $%.2f total',
-                summary.tran_count,
-                summary.tran_total,
-            )
-            return cls(summary=summary)
-        except Exception as e:
-            failed_xml: str = etree.tostring(
-                result_element, pretty_print=True, encoding='unicode'
-            )
-            logger.error(
-                'Failed to parse summary element: %r\n'
-                '--- Failing XML Snippet ---\n%s\n'
-                '--- End Snippet ---',
-                e,
-                failed_xml,
-            )
-            raise ValueError(f'Failed to parse transaction summary: {e}') from e
+        # The summary was validated by from_xml_element; skip re-checking it
+        return cls.model_construct(summary=_parse_summary_element(result_element))
+
+    @classmethod
+    def from_soap_response_streaming(cls, xml_bytes: bytes) -> Self:
+        """
+        Read the transaction summary from raw response bytes.
+
+        Produces the same summary as from_soap_response, but stops reading
+        once the single <result> element closes.
+
+        Args:
+            xml_bytes: The raw XML response from the SOAP API, as bytes
+                (e.g. requests.Response.content).
+
+        Returns:
+            A TransSummaryResponse with the summary data.
+
+        Raises:
+            RuntimeError: If the response contains a SOAP Fault.
+            ValueError: If the response has no SOAP Body or the summary fails
+                validation.
+            etree.XMLSyntaxError: If the XML is malformed.
+        """
+        logger.debug('Streaming SOAP response for TransSummaryResponse')
+
+        result_element: etree.Element | None = stream_soap_result(xml_bytes)
+
+        if result_element is None:
+            logger.warning('No <result> element found in the response body.')
+            return cls(summary=None)
+
+        return cls.model_construct(summary=_parse_summary_element(result_element))
 
     def __repr__(self) -> str:
         if self.summary:
-            return (
-                f'TransSummaryResponse('
-                f'count={self.summary.tran_count}, '
-                f'total=${self.summary.tran_total:.2f})'
-            )
+            return f'TransSummaryResponse({_format_counts(self.summary)})'
         return 'TransSummaryResponse(summary=None)'
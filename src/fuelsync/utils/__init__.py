@@ -5,26 +5,40 @@ from .datetime_utils import format_for_soap
 from .file_io import ParquetFileHandler
 from .logger import setup_logger
 from .login import login_to_efs
-from .model_tools import is_nil, parse_xml_to_dict
-from .xml_parser import check_for_soap_fault, extract_soap_body, parse_soap_response
+from .model_tools import (
+    intern_optional_str,
+    is_nil,
+    parse_xml_to_dict,
+    rows_to_columns,
+)
+from .xml_parser import (
+    XP_RESULT_VALUES,
+    LazyXmlSnippet,
+    check_for_soap_fault,
+    extract_soap_body,
+    find_soap_result,
+    iter_soap_result_values,
+    parse_soap_response,
+    stream_soap_result,
+)
 
 __all__: list[str] = [
+    'XP_RESULT_VALUES',
     'FuelSyncConfig',
-    # file_io.py
+    'LazyXmlSnippet',
     'ParquetFileHandler',
     'check_for_soap_fault',
     'extract_soap_body',
-    # datetime_utils.py
+    'find_soap_result',
     'format_for_soap',
-    # model_tools.py
+    'intern_optional_str',
     'is_nil',
-    # config_loader.py
+    'iter_soap_result_values',
     'load_config',
-    # login.py
     'login_to_efs',
-    # xml_parser.py
     'parse_soap_response',
     'parse_xml_to_dict',
-    # logger.py
+    'rows_to_columns',
     'setup_logger',
+    'stream_soap_result',
 ]
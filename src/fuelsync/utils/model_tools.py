@@ -7,15 +7,25 @@ structuring it into dictionaries that match Pydantic model definitions.
 It bridges the gap between raw XML (via lxml) and typed Python objects (via Pydantic).
 """
 
+import functools
 import logging
+import sys
 import types
-from typing import Any, Union, get_args, get_origin
+from collections.abc import Iterable
+from enum import Enum
+from typing import Any, NamedTuple, Union, get_args, get_origin
 
 from lxml import etree
 from pydantic import BaseModel
+from pydantic.dataclasses import is_pydantic_dataclass
+from pydantic.fields import FieldInfo
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Fully qualified xsi:nil attribute name and the values that mark an element nil
+_XSI_NIL_ATTR: str = '{http://www.w3.org/2001/XMLSchema-instance}nil'
+_NIL_VALUES: frozenset[str] = frozenset({'1', 'true'})
+
 
 def is_nil(element: etree.Element | None) -> bool:
     """
@@ -37,8 +47,27 @@ def is_nil(element: etree.Element | None) -> bool:
     # Check for xsi:nil attribute (with proper namespace)
     # The namespace map is usually handled by lxml, but looking up the
     # fully qualified name is the most robust method.
-    nil_attr: str | None = element.get('{http://www.w3.org/2001/XMLSchema-instance}nil')
-    return nil_attr in {'1', 'true'}
+    nil_attr: str | None = element.get(_XSI_NIL_ATTR)
+    return nil_attr in _NIL_VALUES
+
+
+def intern_optional_str(raw_value: Any) -> Any:
+    """
+    Intern a low-cardinality string so repeats share one object.
+
+    Codes such as card statuses, info types, tax codes and currencies repeat
+    on every record, while lxml returns a fresh str for each occurrence. Meant
+    for use in mode='before' field validators.
+
+    Args:
+        raw_value: Raw value from the API.
+
+    Returns:
+        The interned string, or the value unchanged if it is not a str.
+    """
+    if type(raw_value) is str:
+        return sys.intern(raw_value)
+    return raw_value
 
 
 def extract_text(element: etree.Element, tag: str) -> str | None:
@@ -60,19 +89,9 @@ def extract_text(element: etree.Element, tag: str) -> str | None:
         None if the tag is missing, explicitly nil, or contains only whitespace.
     """
     child: etree.Element | None = element.find(tag)
-
-    # Check if child exists and isn't explicitly marked as nil
-    if child is None or is_nil(child):
-        return None
-
-    # Get the text content
-    text: str | None = child.text
-
-    # Return None if text is None or empty string after stripping
-    if text is None or not text.strip():
+    if child is None:
         return None
-
-    return text.strip()
+    return _element_text(child)
 
 
 # --- Type Introspection Helpers ---
@@ -144,137 +163,238 @@ def _get_list_item_type(field_type: Any) -> Any | None:
 
 def _is_pydantic_model(field_type: Any) -> bool:
     """
-    Check if a type is a Pydantic BaseModel subclass.
+    Check if a type is a Pydantic BaseModel subclass or Pydantic dataclass.
 
     Args:
         field_type: A type annotation.
 
     Returns:
-        True if the type is a Pydantic model, False otherwise.
+        True if the type is a Pydantic model or dataclass, False otherwise.
     """
-    return isinstance(field_type, type) and issubclass(field_type, BaseModel)
+    if not isinstance(field_type, type):
+        return False
+    return issubclass(field_type, BaseModel) or is_pydantic_dataclass(field_type)
 
 
-# --- Field Parsing Helpers ---
+def _model_fields(model_class: type) -> dict[str, FieldInfo]:
+    """
+    Return the field table of a Pydantic model or Pydantic dataclass.
 
+    Args:
+        model_class: A BaseModel subclass or Pydantic dataclass.
 
-def _parse_primitive_list(
-    element: etree.Element,
-    xml_tag: str,
-) -> list[str | None]:
+    Returns:
+        Mapping of field name -> FieldInfo, in definition order.
+    """
+    if issubclass(model_class, BaseModel):
+        return model_class.model_fields
+    return model_class.__pydantic_fields__  # pyright: ignore[reportAttributeAccessIssue]
+
+
+# --- Field Specs ---
+
+
+class FieldKind(Enum):
+    """How a model field is represented in XML."""
+
+    PRIMITIVE = 'primitive'
+    PRIMITIVE_LIST = 'primitive_list'
+    MODEL = 'model'
+    MODEL_LIST = 'model_list'
+
+
+class FieldSpec(NamedTuple):
+    """
+    Precomputed parsing instructions for one model field.
+
+    Attributes:
+        field_name: Python attribute name on the model.
+        xml_tag: XML tag to read (the field alias, or the field name).
+        kind: How the field is laid out in XML.
+        model_class: Nested model class for MODEL / MODEL_LIST fields, else None.
     """
-    Parse a list of primitive values from repeated XML tags.
 
-    Example XML:
-        <items>value1</items>
-        <items>value2</items>
-        <items xsi:nil="true"/>
+    field_name: str
+    xml_tag: str
+    kind: FieldKind
+    model_class: type | None = None
+
+
+@functools.cache
+def get_field_specs(model_class: type) -> tuple[FieldSpec, ...]:
+    """
+    Build the field spec table for a Pydantic model.
+
+    The type introspection (Optional unwrapping, list/model detection) runs once
+    per model class; the result is cached and reused for every element parsed.
 
     Args:
-        element: Parent XML element.
-        xml_tag: Name of the repeating child tag.
+        model_class: The Pydantic model (or dataclass) definition to inspect.
 
     Returns:
-        List of string values (or None for nil/empty elements).
+        One FieldSpec per model field, in field definition order.
     """
-    nested_elements: list[etree.Element] = element.findall(xml_tag)
-    result: list[str | None] = []
+    specs: list[FieldSpec] = []
 
-    for elem in nested_elements:
-        if is_nil(elem):
-            result.append(None)
-        else:
-            text: str | None = elem.text
-            if text and text.strip():
-                result.append(text.strip())
+    for field_name, field_info in _model_fields(model_class).items():
+        # Get the XML tag name (alias) or fallback to Python field name
+        xml_tag: str = field_info.alias or field_name
+
+        # Get the field type and unwrap Optional[X] if needed
+        actual_type: Any = _unwrap_optional(field_info.annotation)
+
+        if _is_list_type(actual_type):
+            item_type: Any | None = _get_list_item_type(actual_type)
+            if item_type and _is_pydantic_model(item_type):
+                specs.append(
+                    FieldSpec(field_name, xml_tag, FieldKind.MODEL_LIST, item_type)
+                )
             else:
-                result.append(None)
+                specs.append(FieldSpec(field_name, xml_tag, FieldKind.PRIMITIVE_LIST))
+        elif _is_pydantic_model(actual_type):
+            specs.append(FieldSpec(field_name, xml_tag, FieldKind.MODEL, actual_type))
+        else:
+            specs.append(FieldSpec(field_name, xml_tag, FieldKind.PRIMITIVE))
 
-    return result
+    return tuple(specs)
 
 
-def _parse_model_list(
-    element: etree.Element,
-    xml_tag: str,
-    model_class: type[BaseModel],
-) -> list[dict[str, Any]]:
+@functools.cache
+def _flat_tag_map(model_class: type) -> dict[str, str] | None:
     """
-    Parse a list of nested Pydantic models from repeated XML tags.
+    Map XML tag -> field name for models made only of primitive fields.
 
-    Example XML:
-        <lineItems><amount>10.5</amount></lineItems>
-        <lineItems><amount>20.0</amount></lineItems>
+    Small leaf models (info entries, taxes, metadata) are parsed with a single
+    dispatch loop over their children instead of building a child index.
 
     Args:
-        element: Parent XML element.
-        xml_tag: Name of the repeating child tag.
-        model_class: The Pydantic model class for each list item.
+        model_class: The Pydantic model (or dataclass) definition to inspect.
 
     Returns:
-        List of dictionaries, each representing a parsed model.
+        The tag map, or None if the model has any list or nested model field.
     """
-    nested_elements: list[etree.Element] = element.findall(xml_tag)
-
-    if not nested_elements:
-        return []
+    specs: tuple[FieldSpec, ...] = get_field_specs(model_class)
+    if any(spec.kind is not FieldKind.PRIMITIVE for spec in specs):
+        return None
+    return {spec.xml_tag: spec.field_name for spec in specs}
 
-    logger.debug(
-        'Parsing list field (tag %r): found %d items', xml_tag, len(nested_elements)
-    )
 
-    # Recursively parse each nested element
-    return [
-        parse_xml_to_dict(nested_elem, model_class)
-        for nested_elem in nested_elements
-        if not is_nil(nested_elem)
-    ]
+@functools.cache
+def _tag_specs(model_class: type) -> dict[str, FieldSpec]:
+    """
+    Map XML tag -> FieldSpec for dispatching children in one pass.
 
+    Args:
+        model_class: The Pydantic model (or dataclass) definition to inspect.
 
-def _parse_nested_model(
-    element: etree.Element,
-    xml_tag: str,
-    model_class: type[BaseModel],
-) -> dict[str, Any] | None:
+    Returns:
+        The tag -> spec mapping.
     """
-    Parse a single nested Pydantic model from an XML tag.
+    return {spec.xml_tag: spec for spec in get_field_specs(model_class)}
+
 
-    Example XML:
-        <fleetMemo><cardNumber>123</cardNumber></fleetMemo>
+@functools.cache
+def _list_field_names(model_class: type) -> tuple[str, ...]:
+    """
+    Names of list-typed fields, which default to [] when no tags are present.
 
     Args:
-        element: Parent XML element.
-        xml_tag: Name of the child tag containing the nested model.
-        model_class: The Pydantic model class for the nested object.
+        model_class: The Pydantic model (or dataclass) definition to inspect.
 
     Returns:
-        Dictionary representing the parsed model, or None if tag missing/nil.
+        Field names of PRIMITIVE_LIST and MODEL_LIST fields.
     """
-    nested_elem: etree.Element | None = element.find(xml_tag)
+    return tuple(
+        spec.field_name
+        for spec in get_field_specs(model_class)
+        if spec.kind in {FieldKind.PRIMITIVE_LIST, FieldKind.MODEL_LIST}
+    )
 
-    if nested_elem is None or is_nil(nested_elem):
-        return None
 
-    # Recursively parse the nested model
-    return parse_xml_to_dict(nested_elem, model_class)
+# --- Field Parsing Helpers ---
 
 
-def _parse_primitive_field(
-    element: etree.Element,
-    xml_tag: str,
-) -> str | None:
+def _element_text(element: etree.Element) -> str | None:
+    """
+    Return the stripped text of an element, or None if nil, missing, or blank.
+
+    Args:
+        element: The XML element to read.
+
+    Returns:
+        The stripped text, or None.
+    """
+    # Check text first: most values are present, and the nil attribute lookup
+    # is only needed once there is text to discard.
+    text: str | None = element.text
+    if text is None:
+        return None
+    stripped: str = text.strip()
+    if not stripped or element.get(_XSI_NIL_ATTR) in _NIL_VALUES:
+        return None
+    return stripped
+
+
+def _parse_flat(element: etree.Element, tag_map: dict[str, str]) -> dict[str, Any]:
     """
-    Parse a simple primitive field (str, int, float, bool, datetime, etc.).
+    Parse a primitive-only element in one pass over its children.
 
-    Pydantic will handle the actual type conversion - this just extracts raw text.
+    Matches parse_xml_to_dict semantics: the first occurrence of a tag wins,
+    and nil or blank values are omitted.
 
     Args:
-        element: Parent XML element.
-        xml_tag: Name of the child tag to extract.
+        element: The XML element containing data for the model.
+        tag_map: XML tag -> field name, from _flat_tag_map.
 
     Returns:
-        Raw string value, or None if missing/nil/empty.
+        A dictionary containing the extracted data, ready for model_validate().
     """
-    return extract_text(element, xml_tag)
+    data: dict[str, Any] = {}
+    seen: set[str] = set()
+
+    for child in element.iterchildren(etree.Element):
+        field_name: str | None = tag_map.get(child.tag)
+        if field_name is None or field_name in seen:
+            continue
+        seen.add(field_name)
+
+        # Inlined _element_text: this loop runs for every leaf value
+        text: str | None = child.text
+        if text is None:
+            continue
+        stripped: str = text.strip()
+        if stripped and child.get(_XSI_NIL_ATTR) not in _NIL_VALUES:
+            data[field_name] = stripped
+
+    return data
+
+
+def _append_list_item(data: dict[str, Any], field_name: str, item: Any) -> None:
+    """
+    Append to a list field, creating the list on its first item.
+
+    Args:
+        data: The dictionary being built.
+        field_name: The list field's name.
+        item: The parsed item to append.
+    """
+    if field_name in data:
+        data[field_name].append(item)
+    else:
+        data[field_name] = [item]
+
+
+def _fill_missing_lists(data: dict[str, Any], model_class: type) -> None:
+    """
+    Default list fields with no tags present to [] (empty, not missing).
+
+    Args:
+        data: The dictionary being built.
+        model_class: The model the dictionary is for.
+    """
+    for list_field_name in _list_field_names(model_class):
+        if list_field_name not in data:
+            data[list_field_name] = []
 
 
 # --- Main Parser ---
@@ -282,18 +402,19 @@ def _parse_primitive_field(
 
 def parse_xml_to_dict(
     element: etree.Element,
-    model_class: type[BaseModel],
+    model_class: type,
 ) -> dict[str, Any]:
     """
     Parse an XML element into a dictionary structure matching a Pydantic model.
 
-    This function introspects the Pydantic model to determine which XML tags to
-    look for and how to structure the output. It dispatches to specialized helpers
-    for each field type (primitive, nested model, or list).
+    The element's children are walked once and dispatched through the model's
+    cached field spec table (see get_field_specs) by tag, handling each field
+    type (primitive, nested model, or list). Lists are only allocated for tags
+    that are present; models with only primitive fields take a leaner loop.
 
     Args:
         element: The root XML element containing data for this model.
-        model_class: The Pydantic model class definition to inspect.
+        model_class: The Pydantic model (or dataclass) definition to inspect.
 
     Returns:
         A dictionary containing the extracted data, ready for model_validate().
@@ -302,39 +423,85 @@ def parse_xml_to_dict(
         >>> data = parse_xml_to_dict(xml_element, TransactionModel)
         >>> model = TransactionModel.model_validate(data)
     """
-    data: dict[str, Any] = {}
+    tag_map: dict[str, str] | None = _flat_tag_map(model_class)
+    if tag_map is not None:
+        return _parse_flat(element, tag_map)
 
-    for field_name, field_info in model_class.model_fields.items():
-        # Get the XML tag name (alias) or fallback to Python field name
-        xml_tag: str = field_info.alias or field_name
+    tag_specs: dict[str, FieldSpec] = _tag_specs(model_class)
+    data: dict[str, Any] = {}
+    seen: set[str] = set()
+
+    for child in element.iterchildren(etree.Element):
+        spec: FieldSpec | None = tag_specs.get(child.tag)
+        if spec is None:
+            continue
+        field_name: str = spec.field_name
+        kind: FieldKind = spec.kind
+
+        if kind is FieldKind.PRIMITIVE:
+            # Simple primitive field (first occurrence wins); Pydantic handles
+            # the type conversion
+            if field_name not in seen:
+                seen.add(field_name)
+                parsed: str | None = _element_text(child)
+                if parsed is not None:
+                    data[field_name] = parsed
+
+        elif kind is FieldKind.MODEL_LIST:
+            # Repeated nested models; nil items are dropped
+            if child.get(_XSI_NIL_ATTR) not in _NIL_VALUES:
+                _append_list_item(
+                    data,
+                    field_name,
+                    parse_xml_to_dict(
+                        child,
+                        spec.model_class,  # pyright: ignore[reportArgumentType]
+                    ),
+                )
+
+        elif kind is FieldKind.PRIMITIVE_LIST:
+            _append_list_item(data, field_name, _element_text(child))
+
+        # Single nested model: first occurrence wins, skipped if explicitly nil
+        elif field_name not in seen:
+            seen.add(field_name)
+            if child.get(_XSI_NIL_ATTR) not in _NIL_VALUES:
+                data[field_name] = parse_xml_to_dict(
+                    child,
+                    spec.model_class,  # pyright: ignore[reportArgumentType]
+                )
+
+    _fill_missing_lists(data, model_class)
+    return data
 
-        # Get the field type and unwrap Optional[X] if needed
-        field_type: Any = field_info.annotation
-        actual_type: Any = _unwrap_optional(field_type)
 
-        # Dispatch to appropriate parser based on type
-        if _is_list_type(actual_type):
-            item_type: Any | None = _get_list_item_type(actual_type)
+def rows_to_columns(
+    rows: Iterable[tuple[Any, ...]], column_names: Iterable[str]
+) -> dict[str, list[Any]]:
+    """
+    Transpose positional row tuples into named column lists.
 
-            if item_type and _is_pydantic_model(item_type):
-                # List of nested models
-                data[field_name] = _parse_model_list(element, xml_tag, item_type)
-            else:
-                # List of primitives
-                data[field_name] = _parse_primitive_list(element, xml_tag)
+    Response models read each record as one value tuple (typically through an
+    operator.attrgetter) and hand the rows here, so no per-record dict is built
+    on the way to a DataFrame or Arrow table.
 
-        elif _is_pydantic_model(actual_type):
-            # Single nested model
-            nested_parsed: dict[str, Any] | None = _parse_nested_model(
-                element, xml_tag, actual_type
-            )
-            if nested_parsed is not None:
-                data[field_name] = nested_parsed
+    Args:
+        rows: Row tuples whose positions follow column_names, as a list or a
+            stream (e.g. map(getter, records)).
+        column_names: Output column names, one per tuple position.
 
-        else:
-            # Simple primitive field
-            parsed: str | None = _parse_primitive_field(element, xml_tag)
-            if parsed is not None:
-                data[field_name] = parsed
+    Returns:
+        Column name -> list of values, one per row. Every column is present
+        (and empty) when there are no rows.
 
-    return data
+    Example:
+        >>> rows_to_columns([(1, 'a'), (2, None)], ('id', 'name'))
+        {'id': [1, 2], 'name': ['a', None]}
+    """
+    transposed: list[tuple[Any, ...]] = list(zip(*rows, strict=True))
+    if not transposed:
+        return {col_name: [] for col_name in column_names}
+    return {
+        col_name: list(values)
+        for col_name, values in zip(column_names, transposed, strict=True)
+    }
@@ -6,15 +6,69 @@ Provides helper functions for parsing SOAP XML responses with proper
 namespace handling.
 """
 
+import io
+import logging
+from collections.abc import Iterator
+
 from lxml import etree
 
+logger: logging.Logger = logging.getLogger(__name__)
+
+SOAP_ENV_NAMESPACE: str = 'http://schemas.xmlsoap.org/soap/envelope/'
+
+# Clark-notation tags, so lookups need no per-call prefix mapping
+_SOAP_BODY_TAG: str = f'{{{SOAP_ENV_NAMESPACE}}}Body'
+_SOAP_FAULT_TAG: str = f'{{{SOAP_ENV_NAMESPACE}}}Fault'
+
+# Parser options for every response, shared by the tree and streaming paths
+# so both see the same document. Dropping whitespace-only text nodes makes
+# pretty-printed responses cheaper to parse, ID collection is unused, and
+# entity expansion is never wanted from a remote service.
+_SOAP_PARSER_OPTIONS: dict[str, bool] = {
+    'remove_blank_text': True,
+    'collect_ids': False,
+    'resolve_entities': False,
+}
+
+# lxml guards each parser's context with a lock, so sharing it is thread-safe
+_SOAP_PARSER: etree.XMLParser = etree.XMLParser(**_SOAP_PARSER_OPTIONS)
+
+# Precompiled XPath evaluators shared by every response model, so no call
+# compiles a path. The structural path (Body -> operation response -> result)
+# avoids a full descendant scan; the descendant form is kept as a fallback for
+# unexpected envelope shapes.
+_XP_RESULT: etree.XPath = etree.XPath('./*/result')
+_XP_RESULT_ANY: etree.XPath = etree.XPath('.//result')
+XP_RESULT_VALUES: etree.XPath = etree.XPath('./value')
 
-def parse_soap_response(xml_string: str) -> etree.Element:
+
+class LazyXmlSnippet:
+    """
+    Pretty-printed XML for an element, rendered only when actually logged.
+
+    Pass as a logging argument (e.g. logger.error('...%s', LazyXmlSnippet(el)))
+    so serialization is skipped when the record is filtered out by level.
     """
-    Parse a SOAP XML response string into an lxml Element.
+
+    __slots__ = ('_element',)
+
+    def __init__(self, element: etree.Element) -> None:
+        self._element: etree.Element = element
+
+    def __str__(self) -> str:
+        return etree.tostring(self._element, pretty_print=True, encoding='unicode')
+
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+
+def parse_soap_response(xml_string: str | bytes) -> etree.Element:
+    """
+    Parse a SOAP XML response into an lxml Element.
 
     Args:
-        xml_string: The raw XML response from the SOAP API.
+        xml_string: The raw XML response from the SOAP API, as text or as
+            bytes (e.g. requests.Response.content, which skips re-encoding).
 
     Returns:
         The root element of the parsed XML tree.
@@ -22,7 +76,28 @@ def parse_soap_response(xml_string: str) -> etree.Element:
     Raises:
         etree.XMLSyntaxError: If the XML is malformed.
     """
-    return etree.fromstring(xml_string.encode('utf-8'))
+    xml_bytes: bytes = (
+        xml_string.encode('utf-8') if isinstance(xml_string, str) else xml_string
+    )
+    return etree.fromstring(xml_bytes, _SOAP_PARSER)
+
+
+def _find_soap_body(root: etree.Element) -> etree.Element | None:
+    """
+    Find the Body element of a SOAP envelope.
+
+    Args:
+        root: The root element of the SOAP envelope.
+
+    Returns:
+        The Body element, or None if the envelope has none.
+    """
+    # Body is normally a direct child of the Envelope; only fall back to a
+    # descendant search (which walks the whole tree) when it is not.
+    body: etree.Element | None = root.find(_SOAP_BODY_TAG)
+    if body is None:
+        body = root.find(f'.//{_SOAP_BODY_TAG}')
+    return body
 
 
 def extract_soap_body(root: etree.Element) -> etree.Element:
@@ -38,13 +113,7 @@ def extract_soap_body(root: etree.Element) -> etree.Element:
     Raises:
         ValueError: If no Body element is found.
     """
-    # Define SOAP namespace
-    namespaces: dict[str, str] = {
-        'soap': 'http://schemas.xmlsoap.org/soap/envelope/',
-    }
-
-    body: etree.Element | None = root.find('.//soap:Body', namespaces=namespaces)
-
+    body: etree.Element | None = _find_soap_body(root)
     if body is None:
         raise ValueError('No SOAP Body element found in response')
 
@@ -56,18 +125,171 @@ def check_for_soap_fault(root: etree.Element) -> None:
     Check if the SOAP response contains a Fault element and raise if found.
 
     Args:
-        root: The root element of the SOAP envelope.
+        root: The SOAP Envelope element, or its Body element.
 
     Raises:
         RuntimeError: If a SOAP Fault is found in the response.
     """
-    namespaces: dict[str, str] = {
-        'soap': 'http://schemas.xmlsoap.org/soap/envelope/',
-    }
-
-    fault: etree.Element | None = root.find('.//soap:Fault', namespaces=namespaces)
+    # Resolve Body the same way extract_soap_body does, then look one level
+    # down only: a Fault is always a direct child of Body, so there is no
+    # descendant scan over a (possibly large) successful response.
+    body: etree.Element | None = (
+        root if root.tag == _SOAP_BODY_TAG else _find_soap_body(root)
+    )
+    fault: etree.Element | None = (
+        body.find(_SOAP_FAULT_TAG) if body is not None else None
+    )
 
     if fault is not None:
-        fault_code: str = fault.findtext('faultcode', default='Unknown')
-        fault_string: str = fault.findtext('faultstring', default='Unknown error')
-        raise RuntimeError(f'SOAP Fault [{fault_code}]: {fault_string}')
+        _raise_soap_fault(fault)
+
+
+def find_soap_result(body: etree.Element) -> etree.Element | None:
+    """
+    Find the <result> element of a SOAP response body.
+
+    Args:
+        body: The SOAP Body element.
+
+    Returns:
+        The first <result> element, or None if the body has none.
+    """
+    result_matches: list[etree.Element] = _XP_RESULT(body) or _XP_RESULT_ANY(body)
+    return result_matches[0] if result_matches else None
+
+
+def _raise_soap_fault(fault: etree.Element) -> None:
+    """
+    Raise a RuntimeError describing a SOAP Fault element.
+
+    Args:
+        fault: The soap:Fault element.
+
+    Raises:
+        RuntimeError: Always, with the fault code and string.
+    """
+    fault_code: str = fault.findtext('faultcode', default='Unknown')
+    fault_string: str = fault.findtext('faultstring', default='Unknown error')
+    raise RuntimeError(f'SOAP Fault [{fault_code}]: {fault_string}')
+
+
+def stream_soap_result(xml_bytes: bytes) -> etree.Element | None:
+    """
+    Incrementally parse a SOAP response up to its first <result> element.
+
+    Uses iterparse on 'end' events and stops as soon as a <result> element
+    inside the Body is complete, so the rest of the input is not read and no
+    full tree is kept. Meant for single-record responses, where the result is
+    the whole payload. Faults and a missing Body are reported the same way as
+    by extract_soap_body and check_for_soap_fault.
+
+    Args:
+        xml_bytes: The raw XML response from the SOAP API, as bytes.
+
+    Returns:
+        The first completed <result> element, or None if the Body has none.
+
+    Raises:
+        RuntimeError: If a SOAP Fault is found in the response.
+        ValueError: If no Body element is found.
+        etree.XMLSyntaxError: If the XML before the result is malformed.
+    """
+    context: etree.iterparse = etree.iterparse(
+        io.BytesIO(xml_bytes),
+        events=('end',),
+        tag=('result', _SOAP_BODY_TAG, _SOAP_FAULT_TAG),
+        **_SOAP_PARSER_OPTIONS,
+    )
+
+    for _event, element in context:
+        if element.tag == 'result':
+            if next(element.iterancestors(_SOAP_BODY_TAG), None) is not None:
+                return element
+        elif element.tag == _SOAP_BODY_TAG:
+            # The Body closed without a <result>
+            return None
+        elif _is_body_child(element):
+            _raise_soap_fault(element)
+
+    raise ValueError('No SOAP Body element found in response')
+
+
+def iter_soap_result_values(xml_bytes: bytes) -> Iterator[etree.Element]:
+    """
+    Stream the <value> children of <result> elements from a SOAP response.
+
+    Uses iterparse on 'end' events so each <value> is complete when yielded.
+    After the consumer moves on, the element is cleared and removed from its
+    parent, keeping memory bounded by one record rather than the whole
+    response. Consumers must not keep references to yielded elements.
+
+    Checks the envelope the same way the tree path does: a Fault under the
+    Body raises, a missing Body raises once the input is exhausted, and a
+    Body without a <result> or without <value> records logs a warning.
+
+    Args:
+        xml_bytes: The raw XML response from the SOAP API, as bytes.
+
+    Yields:
+        Each <value> element whose parent is a <result> element.
+
+    Raises:
+        RuntimeError: If a SOAP Fault is found in the response.
+        ValueError: If no Body element is found.
+        etree.XMLSyntaxError: If the XML is malformed.
+    """
+    context: etree.iterparse = etree.iterparse(
+        io.BytesIO(xml_bytes),
+        events=('end',),
+        tag=('value', 'result', _SOAP_BODY_TAG, _SOAP_FAULT_TAG),
+        **_SOAP_PARSER_OPTIONS,
+    )
+    found_body: bool = False
+    found_result: bool = False
+    value_count: int = 0
+
+    for _event, element in context:
+        tag: str = element.tag
+        if tag != 'value':
+            if tag == 'result':
+                found_result = True
+            elif tag == _SOAP_BODY_TAG:
+                found_body = True
+            elif _is_body_child(element):
+                _raise_soap_fault(element)
+            continue
+
+        # Records can contain their own <value> children (e.g. <infos>); only
+        # direct children of <result> are records.
+        parent: etree.Element | None = element.getparent()
+        if parent is None or parent.tag != 'result':
+            continue
+
+        value_count += 1
+        yield element
+
+        # Free the processed record and any earlier siblings
+        element.clear(keep_tail=True)
+        while element.getprevious() is not None:
+            del parent[0]
+
+    if not found_body:
+        raise ValueError('No SOAP Body element found in response')
+    if not found_result:
+        logger.warning('No <result> element found in the response body.')
+    elif not value_count:
+        logger.warning('No <value> elements found in the response body.')
+
+
+def _is_body_child(element: etree.Element) -> bool:
+    """
+    Check whether an element sits directly under a SOAP Body.
+
+    Args:
+        element: The element to check.
+
+    Returns:
+        True if the element's parent is a Body element.
+    """
+    parent: etree.Element | None = element.getparent()
+    return parent is not None and parent.tag == _SOAP_BODY_TAG
@@ -0,0 +1,157 @@
+"""Tests for card summary response parsing."""
+
+import logging
+
+import pytest
+
+from fuelsync.response_models.card_summary_response import (
+    CARD_ARROW_SCHEMA,
+    CARD_FIELD_MAP,
+    GetCardSummariesResponse,
+    WSCardSummary,
+    _warn_unexpected_statuses,
+)
+
+_CARD_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+    <soapenv:Body>
+        <ns1:getCardSummariesResponse xmlns:ns1="http://ws.efs.com">
+            <result>
+                <value>
+                    <cardNumber>7083050000000001</cardNumber>
+                    <policyNumber>1</policyNumber>
+                    <unitNumber>TRK1</unitNumber>
+                    <override>0</override>
+                    <beingOverridden>false</beingOverridden>
+                    <status>ACTIVE</status>
+                    <payrollStatus>FOLLOWS</payrollStatus>
+                </value>
+                <value>
+                    <cardNumber>7083050000000002</cardNumber>
+                    <policyNumber>500</policyNumber>
+                    <override>0</override>
+                    <beingOverridden>false</beingOverridden>
+                    <status>ACTIVE</status>
+                    <payrollStatus>FOLLOWS</payrollStatus>
+                </value>
+                <value>
+                    <cardNumber>7083050000000003</cardNumber>
+                    <policyNumber>2</policyNumber>
+                    <override>1</override>
+                    <beingOverridden>true</beingOverridden>
+                    <status>HOLD</status>
+                    <payrollStatus>INACTIVE</payrollStatus>
+                </value>
+            </result>
+        </ns1:getCardSummariesResponse>
+    </soapenv:Body>
+</soapenv:Envelope>"""
+
+
+class TestFromSoapResponse:
+    """Tests for GetCardSummariesResponse parsing."""
+
+    def test_invalid_cards_are_skipped(self) -> None:
+        """Test that a card failing validation is logged and skipped."""
+        response = GetCardSummariesResponse.from_soap_response(_CARD_XML)
+        assert [card.card_number for card in response.cards] == [
+            '7083050000000001',
+            '7083050000000003',
+        ]
+
+    def test_streaming_matches_tree_parse(self) -> None:
+        """Test that streaming parsing yields the same cards."""
+        tree_response = GetCardSummariesResponse.from_soap_response(_CARD_XML)
+        streamed_response = GetCardSummariesResponse.from_soap_response_streaming(
+            _CARD_XML.encode()
+        )
+        assert streamed_response.cards == tree_response.cards
+
+    def test_active_card_count_matches_api_codes(self) -> None:
+        """Test that ACTIVE cards are counted regardless of case."""
+        response = GetCardSummariesResponse.from_soap_response(
+            _CARD_XML.replace('<status>HOLD</status>', '<status>active</status>')
+        )
+        assert response.active_card_count == 2  # noqa: PLR2004
+        assert (
+            GetCardSummariesResponse.from_soap_response(_CARD_XML).active_card_count
+            == 1
+        )
+
+
+class TestToDataframe:
+    """Tests for GetCardSummariesResponse.to_dataframe."""
+
+    def test_one_row_per_card_in_field_map_order(self) -> None:
+        """Test that each card becomes a row with every mapped column."""
+        df = GetCardSummariesResponse.from_soap_response(_CARD_XML).to_dataframe()
+        assert list(df.columns) == list(CARD_FIELD_MAP.values())
+        assert df['policy_number'].tolist() == [1, 2]
+        assert df['being_overridden'].tolist() == [False, True]
+        assert df['unit_number'].isna().tolist() == [False, True]
+
+    def test_empty_response_keeps_columns(self) -> None:
+        """Test that an empty response still has the full column schema."""
+        df = GetCardSummariesResponse().to_dataframe()
+        assert df.empty
+        assert list(df.columns) == list(CARD_FIELD_MAP.values())
+
+    def test_empty_response_dtypes_match_populated(self) -> None:
+        """Test that typed columns keep their dtype when there are no cards."""
+        empty_df = GetCardSummariesResponse().to_dataframe()
+        df = GetCardSummariesResponse.from_soap_response(_CARD_XML).to_dataframe()
+        for col_name in ('card_number', 'policy_number', 'being_overridden', 'status'):
+            assert empty_df[col_name].dtype == df[col_name].dtype
+
+
+class TestWarnUnexpectedStatuses:
+    """Tests for _warn_unexpected_statuses function."""
+
+    def test_one_warning_per_field(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that repeated unknown statuses are summarized in one warning."""
+        cards = [
+            WSCardSummary.model_construct(status='CLOSED', payroll_status='ACTIVE'),
+            WSCardSummary.model_construct(status='CLOSED', payroll_status='Active'),
+            WSCardSummary.model_construct(status='Hold', payroll_status='FOLLOWS'),
+        ]
+        with caplog.at_level(logging.WARNING):
+            _warn_unexpected_statuses(cards)
+        assert len(caplog.records) == 1
+        assert "{'CLOSED': 2}" in caplog.records[0].getMessage()
+
+    def test_known_statuses_are_silent(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that known statuses, in any case, log nothing."""
+        cards = [
+            WSCardSummary.model_construct(status='active', payroll_status='Inactive')
+        ]
+        with caplog.at_level(logging.WARNING):
+            _warn_unexpected_statuses(cards)
+        assert not caplog.records
+
+
+class TestToArrow:
+    """Tests for GetCardSummariesResponse.to_arrow."""
+
+    def test_table_uses_arrow_schema(self) -> None:
+        """Test that cards are written with the declared Arrow types."""
+        table = GetCardSummariesResponse.from_soap_response(_CARD_XML).to_arrow()
+        assert table.schema == CARD_ARROW_SCHEMA
+        assert table.column('policy_number').to_pylist() == [1, 2]
+        assert table.column('status').to_pylist() == ['ACTIVE', 'HOLD']
+
+    def test_empty_response(self) -> None:
+        """Test that an empty response gives an empty table with the schema."""
+        table = GetCardSummariesResponse().to_arrow()
+        assert table.num_rows == 0
+        assert table.schema == CARD_ARROW_SCHEMA
+
+
+class TestInternedCodes:
+    """Tests for interning of card status codes."""
+
+    def test_parsed_statuses_share_one_object(self) -> None:
+        """Test that equal statuses from different cards are the same object."""
+        response = GetCardSummariesResponse.from_soap_response(
+            _CARD_XML.replace('<status>HOLD</status>', '<status>ACTIVE</status>')
+        )
+        assert response.cards[0].status is response.cards[1].status
@@ -0,0 +1,244 @@
+"""Tests for XML-to-model parsing utilities."""
+
+from lxml import etree
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass
+
+from fuelsync.utils.model_tools import (
+    FieldKind,
+    get_field_specs,
+    intern_optional_str,
+    is_nil,
+    parse_xml_to_dict,
+    rows_to_columns,
+)
+
+
+class _Child(BaseModel):
+    """Nested model used by the parser tests."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    code: str | None = Field(None, alias='code')
+    amount: float | None = Field(None, alias='amount')
+
+
+class _Parent(BaseModel):
+    """Top-level model covering each supported field kind."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    record_id: int = Field(..., alias='recordId')
+    name: str | None = Field(None, alias='name')
+    tags: list[str] = Field(default_factory=list, alias='tags')
+    detail: _Child | None = Field(None, alias='detail')
+    children: list[_Child] = Field(default_factory=list, alias='children')
+
+
+@dataclass(slots=True, frozen=True, config=ConfigDict(populate_by_name=True))
+class _Leaf:
+    """Slotted Pydantic dataclass used as a nested list item."""
+
+    code: str | None = Field(None, alias='leafCode')
+
+
+class _Holder(BaseModel):
+    """Model nesting a Pydantic dataclass."""
+
+    leaves: list[_Leaf] = Field(default_factory=list, alias='leaves')
+
+
+def _element(xml: str) -> etree.Element:
+    return etree.fromstring(xml)
+
+
+class TestIsNil:
+    """Tests for is_nil function."""
+
+    def test_none_is_nil(self) -> None:
+        """Test that a missing element counts as nil."""
+        assert is_nil(None)
+
+    def test_xsi_nil_true(self) -> None:
+        """Test that xsi:nil='true' is detected."""
+        element = _element(
+            '<a xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:nil="true"/>'
+        )
+        assert is_nil(element)
+
+    def test_plain_element_is_not_nil(self) -> None:
+        """Test that an element without xsi:nil is not nil."""
+        assert not is_nil(_element('<a>1</a>'))
+
+
+class TestInternOptionalStr:
+    """Tests for intern_optional_str function."""
+
+    def test_equal_strings_share_one_object(self) -> None:
+        """Test that equal strings built separately come back identical."""
+        first = intern_optional_str(''.join(['AC', 'TIVE']))
+        second = intern_optional_str(''.join(['ACT', 'IVE']))
+        assert first == 'ACTIVE'
+        assert first is second
+
+    def test_non_strings_pass_through(self) -> None:
+        """Test that None and non-str values are returned unchanged."""
+        assert intern_optional_str(None) is None
+        assert intern_optional_str(3) == 3  # noqa: PLR2004
+
+
+class TestGetFieldSpecs:
+    """Tests for get_field_specs function."""
+
+    def test_field_kinds(self) -> None:
+        """Test that each field is classified by its annotation."""
+        kinds = {spec.field_name: spec.kind for spec in get_field_specs(_Parent)}
+        assert kinds == {
+            'record_id': FieldKind.PRIMITIVE,
+            'name': FieldKind.PRIMITIVE,
+            'tags': FieldKind.PRIMITIVE_LIST,
+            'detail': FieldKind.MODEL,
+            'children': FieldKind.MODEL_LIST,
+        }
+
+    def test_specs_use_aliases_as_tags(self) -> None:
+        """Test that XML tags come from field aliases."""
+        tags = [spec.xml_tag for spec in get_field_specs(_Parent)]
+        assert tags == ['recordId', 'name', 'tags', 'detail', 'children']
+
+    def test_specs_are_cached(self) -> None:
+        """Test that the spec table is built once per model class."""
+        assert get_field_specs(_Parent) is get_field_specs(_Parent)
+
+
+class TestParseXmlToDict:
+    """Tests for parse_xml_to_dict function."""
+
+    def test_parses_all_field_kinds(self) -> None:
+        """Test primitives, lists, and nested models in one element."""
+        element = _element(
+            '<value>'
+            '<recordId> 42 </recordId>'
+            '<name>Truck</name>'
+            '<tags>a</tags><tags> </tags><tags>b</tags>'
+            '<detail><code>X</code></detail>'
+            '<children><code>C1</code><amount>1.5</amount></children>'
+            '<children><code>C2</code></children>'
+            '</value>'
+        )
+        data = parse_xml_to_dict(element, _Parent)
+        assert data == {
+            'record_id': '42',
+            'name': 'Truck',
+            'tags': ['a', None, 'b'],
+            'detail': {'code': 'X'},
+            'children': [{'code': 'C1', 'amount': '1.5'}, {'code': 'C2'}],
+        }
+
+    def test_missing_and_blank_fields(self) -> None:
+        """Test that missing or blank primitives are omitted and lists default."""
+        data = parse_xml_to_dict(
+            _element('<value><recordId>1</recordId><name>  </name></value>'),
+            _Parent,
+        )
+        assert data == {'record_id': '1', 'tags': [], 'children': []}
+
+    def test_nil_elements_are_skipped(self) -> None:
+        """Test that xsi:nil primitives, models, and list items are dropped."""
+        element = _element(
+            '<value xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">'
+            '<recordId>1</recordId>'
+            '<name xsi:nil="true">ignored</name>'
+            '<detail xsi:nil="true"/>'
+            '<children xsi:nil="true"/>'
+            '<children><code>C</code></children>'
+            '</value>'
+        )
+        data = parse_xml_to_dict(element, _Parent)
+        assert 'name' not in data
+        assert 'detail' not in data
+        assert data['children'] == [{'code': 'C'}]
+
+    def test_first_occurrence_wins_for_primitives(self) -> None:
+        """Test that a repeated primitive tag uses the first element."""
+        data = parse_xml_to_dict(
+            _element('<value><recordId>1</recordId><recordId>2</recordId></value>'),
+            _Parent,
+        )
+        assert data['record_id'] == '1'
+
+    def test_comments_are_ignored(self) -> None:
+        """Test that XML comments between fields do not break parsing."""
+        data = parse_xml_to_dict(
+            _element('<value><!-- note --><recordId>7</recordId></value>'),
+            _Parent,
+        )
+        assert data['record_id'] == '7'
+
+    def test_result_validates(self) -> None:
+        """Test that the parsed dict validates into the model."""
+        expected_id = 3
+        expected_amount = 2.25
+        element = _element(
+            f'<value><recordId>{expected_id}</recordId>'
+            f'<children><amount>{expected_amount}</amount></children></value>'
+        )
+        model = _Parent.model_validate(parse_xml_to_dict(element, _Parent))
+        assert model.record_id == expected_id
+        assert model.children[0].amount == expected_amount
+
+
+class TestParseFlatModel:
+    """Tests for the primitive-only fast path of parse_xml_to_dict."""
+
+    def test_flat_model_matches_general_semantics(self) -> None:
+        """Test first-wins, nil, blank, unknown-tag, and comment handling."""
+        element = _element(
+            '<detail xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">'
+            '<!-- note --><code xsi:nil="true"/><code>ignored</code>'
+            '<amount> 3.5 </amount><unknown>x</unknown>'
+            '</detail>'
+        )
+        assert parse_xml_to_dict(element, _Child) == {'amount': '3.5'}
+
+    def test_flat_model_all_fields(self) -> None:
+        """Test that every primitive field is extracted."""
+        element = _element('<detail><code>A</code><amount>1</amount></detail>')
+        assert parse_xml_to_dict(element, _Child) == {'code': 'A', 'amount': '1'}
+
+
+class TestPydanticDataclassSupport:
+    """Tests for parsing into Pydantic dataclasses."""
+
+    def test_dataclass_item_is_model_list(self) -> None:
+        """Test that a list of Pydantic dataclasses is treated as nested models."""
+        (spec,) = get_field_specs(_Holder)
+        assert spec.kind is FieldKind.MODEL_LIST
+        assert spec.model_class is _Leaf
+
+    def test_dataclass_aliases_drive_parsing(self) -> None:
+        """Test that dataclass field aliases map XML tags and validate."""
+        element = _element(
+            '<value><leaves><leafCode>A</leafCode></leaves>'
+            '<leaves><leafCode>B</leafCode></leaves></value>'
+        )
+        holder = _Holder.model_validate(parse_xml_to_dict(element, _Holder))
+        assert holder.leaves == [_Leaf(code='A'), _Leaf(code='B')]
+
+
+class TestRowsToColumns:
+    """Tests for rows_to_columns function."""
+
+    def test_rows_are_transposed(self) -> None:
+        """Test that row positions map onto the named columns."""
+        columns = rows_to_columns([(1, 'a'), (2, None)], ('id', 'name'))
+        assert columns == {'id': [1, 2], 'name': ['a', None]}
+
+    def test_accepts_streamed_rows(self) -> None:
+        """Test that rows and names may be one-shot iterables."""
+        columns = rows_to_columns(iter([(1, 'a')]), {'x': 'id', 'y': 'name'}.values())
+        assert columns == {'id': [1], 'name': ['a']}
+
+    def test_no_rows_gives_empty_columns(self) -> None:
+        """Test that every column is present even without rows."""
+        assert rows_to_columns([], ('id', 'name')) == {'id': [], 'name': []}
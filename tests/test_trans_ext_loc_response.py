@@ -0,0 +1,414 @@
+"""Tests for transaction extended location response helpers."""
+
+import logging
+from datetime import UTC, datetime, timedelta, timezone
+from enum import IntEnum
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fuelsync.response_models.trans_ext_loc_response import (
+    _DATETIME_UNIT,
+    _EPOCH,
+    ALL_COLUMNS,
+    FUEL_TYPE_MAP,
+    ExtractedInfoFields,
+    GetMCTransExtLocV2Response,
+    WSFleetMemo,
+    WSMCTransExtLocV2,
+    WSTransactionInfo,
+    WSTransactionLineItemExt,
+    WSTransTaxes,
+    _coerce_optional_float,
+    _coerce_optional_int,
+    _datetime_column,
+    _decode_fuel_types,
+    _is_null_token,
+    _pivot_info_columns,
+    _repeat_rows,
+    _to_utc,
+    _typed_column,
+)
+
+_TRANS_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+    <soapenv:Body>
+        <ns1:getMCTransExtLocV2Response xmlns:ns1="http://ws.efs.com">
+            <result>
+                <value>
+                    <transactionId>1001</transactionId>
+                    <transactionDate>2025-01-02T03:04:05-05:00</transactionDate>
+                    <cardNumber>7083050000000001</cardNumber>
+                    <locationName>Depot</locationName>
+                    <locationLatitude>41.5</locationLatitude>
+                    <infos><type>UNIT</type><value>TRK1</value></infos>
+                    <infos><type>ODRD</type><value>120345</value></infos>
+                    <lineItems>
+                        <lineNumber>1</lineNumber>
+                        <category>FUEL</category>
+                        <fuelType>2</fuelType>
+                        <quantity>50.5</quantity>
+                        <amount>180.25</amount>
+                        <lineTaxes><taxCode>FED</taxCode><amount>1.5</amount></lineTaxes>
+                        <lineTaxes><taxCode>SFTX</taxCode><amount>2.5</amount></lineTaxes>
+                    </lineItems>
+                    <lineItems>
+                        <lineNumber>2</lineNumber>
+                        <category>DEF</category>
+                        <quantity>3</quantity>
+                        <amount>12</amount>
+                    </lineItems>
+                </value>
+                <value>
+                    <transactionId>1002</transactionId>
+                    <cardNumber>7083050000000002</cardNumber>
+                    <infos><type>ODRD</type><value>null</value></infos>
+                </value>
+            </result>
+        </ns1:getMCTransExtLocV2Response>
+    </soapenv:Body>
+</soapenv:Envelope>"""
+
+
+class TestDecodeFuelTypes:
+    """Tests for _decode_fuel_types function."""
+
+    def test_known_codes(self) -> None:
+        """Test that every mapped fuel type code decodes to its name."""
+        codes = pd.Series(list(FUEL_TYPE_MAP), dtype='Int64')
+        assert list(_decode_fuel_types(codes)) == list(FUEL_TYPE_MAP.values())
+
+    def test_unknown_and_missing_codes(self) -> None:
+        """Test that NA, zero, multi-bit, and unmapped codes decode to None."""
+        codes = pd.Series([None, 0, 3, 64, 1 << 40, -2], dtype='Int64')
+        assert list(_decode_fuel_types(codes)) == [None] * len(codes)
+
+    def test_empty_series(self) -> None:
+        """Test that an empty Series decodes to an empty array."""
+        assert len(_decode_fuel_types(pd.Series([], dtype='Int64'))) == 0
+
+
+class TestToUtc:
+    """Tests for _to_utc function."""
+
+    def test_offset_datetime_converted(self) -> None:
+        """Test that an offset datetime is converted to the same instant in UTC."""
+        local = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=-6)))
+        converted = _to_utc(local)
+        assert converted.tzinfo is UTC
+        assert converted == local
+
+    def test_naive_datetime_assumed_utc(self) -> None:
+        """Test that a naive datetime is labelled UTC without shifting."""
+        naive = datetime(2025, 1, 2, 3)  # noqa: DTZ001
+        assert _to_utc(naive) == datetime(2025, 1, 2, 3, tzinfo=UTC)
+
+    def test_non_datetime_passthrough(self) -> None:
+        """Test that None and strings are returned unchanged."""
+        assert _to_utc(None) is None
+        assert _to_utc('2025-01-02') == '2025-01-02'
+
+
+class _Flag(IntEnum):
+    """IntEnum used to exercise the subclass fallback."""
+
+    SET = 3
+
+
+class TestIsNullToken:
+    """Tests for _is_null_token function."""
+
+    def test_null_placeholders(self) -> None:
+        """Test blank, 'null' and 'add value' in any case and spacing."""
+        for raw_value in ('', ' \n', 'null', ' NULL ', 'Add Value', 'addvalue'):
+            assert _is_null_token(raw_value)
+        assert _is_null_token('add \t value')
+
+    def test_real_values(self) -> None:
+        """Test that values merely resembling placeholders are kept."""
+        for raw_value in ('nul', 'nulls', 'add x value', 'addvalues', 'Alpha', '0'):
+            assert not _is_null_token(raw_value)
+
+
+class TestCoerceOptionalInt:
+    """Tests for _coerce_optional_int function."""
+
+    def test_numeric_strings(self) -> None:
+        """Test that numeric strings, including padded ones, coerce to int."""
+        assert _coerce_optional_int('047078') == 47078  # noqa: PLR2004
+        assert _coerce_optional_int(' 12 ') == 12  # noqa: PLR2004
+
+    def test_numbers_and_subclasses(self) -> None:
+        """Test ints, integral floats, and int subclasses."""
+        assert _coerce_optional_int(7) == 7  # noqa: PLR2004
+        assert _coerce_optional_int(2.0) == 2  # noqa: PLR2004
+        assert _coerce_optional_int(_Flag.SET) == _Flag.SET
+
+    def test_null_like_values(self) -> None:
+        """Test that null-like tokens coerce to None."""
+        for raw_value in (None, '', '  ', 'null', ' NULL ', 'add value'):
+            assert _coerce_optional_int(raw_value) is None
+
+    def test_invalid_values(self) -> None:
+        """Test that bools, fractional floats, and junk strings coerce to None."""
+        for raw_value in ('abc', 2.5, True, b'1'):
+            assert _coerce_optional_int(raw_value) is None
+
+
+class TestCoerceOptionalFloat:
+    """Tests for _coerce_optional_float function."""
+
+    def test_valid_values(self) -> None:
+        """Test that numeric strings and numbers coerce to float."""
+        assert _coerce_optional_float('1.25') == 1.25  # noqa: PLR2004
+        assert _coerce_optional_float(' 3 ') == 3.0  # noqa: PLR2004
+        assert _coerce_optional_float(4) == 4.0  # noqa: PLR2004
+
+    def test_missing_or_invalid_values(self) -> None:
+        """Test that null-like, invalid, and unsupported inputs coerce to None."""
+        for raw_value in (None, 'null', '', 'abc', False, b'1'):
+            assert _coerce_optional_float(raw_value) is None
+
+    def test_invalid_string_is_logged(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that the warning for a non-numeric string names the value."""
+        with caplog.at_level(logging.WARNING):
+            assert _coerce_optional_float('12,5') is None
+        assert "'12,5'" in caplog.text
+
+
+class TestPivotInfoColumns:
+    """Tests for _pivot_info_columns function."""
+
+    def test_matches_extracted_info_fields(self) -> None:
+        """Test that pivoted columns equal per-transaction from_info_list output."""
+        info_lists = [
+            [
+                WSTransactionInfo(info_type='UNIT', info_value=' 1042 '),
+                WSTransactionInfo(info_type='ODRD', info_value='120500'),
+                WSTransactionInfo(info_type='DRID', info_value='null'),
+                WSTransactionInfo(info_type='XXXX', info_value='ignored'),
+                WSTransactionInfo(info_type=None, info_value='ignored'),
+            ],
+            [],
+            [
+                WSTransactionInfo(info_type='NAME', info_value='first'),
+                WSTransactionInfo(info_type='NAME', info_value='last'),
+                WSTransactionInfo(info_type='CLCD', info_value='abc'),
+            ],
+        ]
+        transactions = [
+            WSMCTransExtLocV2.model_construct(infos=infos) for infos in info_lists
+        ]
+
+        columns = _pivot_info_columns(transactions)
+
+        expected_rows = [
+            ExtractedInfoFields.from_info_list(infos).model_dump()
+            for infos in info_lists
+        ]
+        for index, expected_row in enumerate(expected_rows):
+            assert {
+                name: values[index] for name, values in columns.items()
+            } == expected_row
+
+
+class TestTypedColumn:
+    """Tests for _typed_column function."""
+
+    def test_schema_columns_are_typed(self) -> None:
+        """Test that schema columns are built with their nullable dtypes."""
+        assert _typed_column('quantity', [1.5, None]).dtype == pd.Float64Dtype()
+        assert _typed_column('line_number', [1, None]).dtype == pd.Int64Dtype()
+        assert _typed_column('unit', ['A1', None]).dtype == pd.StringDtype()
+
+    def test_unconvertible_values_fall_back_to_list(self) -> None:
+        """Test that values the strict constructor rejects are left for coercion."""
+        values = [1.5, 'not a number']
+        assert _typed_column('quantity', values) is values
+
+    def test_non_schema_column_is_untouched(self) -> None:
+        """Test that columns without a schema dtype are returned unchanged."""
+        values = ['x']
+        assert _typed_column('not_a_column', values) is values
+
+
+class TestRepeatRows:
+    """Tests for _repeat_rows function."""
+
+    def test_typed_array_is_expanded(self) -> None:
+        """Test that each transaction value repeats once per output row."""
+        values = _typed_column('unit', ['A', None, 'B'])
+        expanded = _repeat_rows(values, np.array([0, 0, 1, 2, 2]))
+        assert expanded.dtype == pd.StringDtype()
+        assert expanded.tolist() == ['A', 'A', pd.NA, 'B', 'B']
+
+    def test_list_uses_constructor_inference(self) -> None:
+        """Test that untyped columns get the dtype pandas would infer."""
+        expanded = _repeat_rows([True, False], np.array([1, 0, 0]))
+        assert expanded.dtype.numpy_dtype == np.bool_
+        assert expanded.tolist() == [False, True, True]
+
+
+class TestLineItemRecord:
+    """Tests for the slotted WSTransactionLineItemExt record."""
+
+    def test_validates_from_parsed_fields(self) -> None:
+        """Test that nested line items validate and coerce through the parent."""
+        transaction = WSMCTransExtLocV2.model_validate(
+            {
+                'transaction_id': 1,
+                'line_items': [{'fuel_type': '4', 'lineTaxes': [{'amount': '1.5'}]}],
+            }
+        )
+        (line_item,) = transaction.line_items
+        assert isinstance(line_item, WSTransactionLineItemExt)
+        assert line_item.fuel_type == 4  # noqa: PLR2004
+        assert line_item.line_taxes[0].amount == 1.5  # noqa: PLR2004
+
+    def test_has_no_instance_dict(self) -> None:
+        """Test that line items are slotted."""
+        assert not hasattr(WSTransactionLineItemExt(), '__dict__')
+
+
+class TestDatetimeColumn:
+    """Tests for _datetime_column function."""
+
+    def test_mixed_offsets_and_naive_values(self) -> None:
+        """Test that aware, naive, and missing values convert to UTC."""
+        eastern = timezone(timedelta(hours=-5))
+        column = _datetime_column(
+            [
+                datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=eastern),
+                datetime(2024, 1, 2, 3, 4, 5),  # noqa: DTZ001
+                None,
+            ]
+        )
+        assert column.dtype == pd.to_datetime([_EPOCH], utc=True).dtype
+        assert column[0] == pd.Timestamp('2024-01-02 08:04:05.678901', tz='UTC')
+        assert column[1] == pd.Timestamp('2024-01-02 03:04:05', tz='UTC')
+        assert column[2] is pd.NaT
+
+    def test_strings_fall_back_to_parsing(self) -> None:
+        """Test that unparsed strings still convert via pd.to_datetime."""
+        column = _datetime_column(['2024-01-02T03:04:05-05:00', None])
+        assert column[0] == pd.Timestamp('2024-01-02 08:04:05', tz='UTC')
+        assert column[1] is pd.NaT
+
+    def test_unit_matches_pandas_inference(self) -> None:
+        """Test that both paths use the unit pandas infers for datetimes."""
+        expected_dtype = pd.DatetimeTZDtype(unit=_DATETIME_UNIT, tz='UTC')
+        assert _datetime_column([_EPOCH]).dtype == expected_dtype
+        assert _datetime_column(['1970-01-01T00:00:00Z']).dtype == expected_dtype
+
+
+class TestInternedCodes:
+    """Tests for interning of low-cardinality code fields."""
+
+    def test_repeated_codes_share_one_object(self) -> None:
+        """Test that equal tax codes parsed separately are the same object."""
+        first = WSTransTaxes(tax_code=''.join(['F', 'ED']))
+        second = WSTransTaxes(tax_code=''.join(['FE', 'D']))
+        assert first.tax_code is second.tax_code
+
+    def test_missing_code_stays_none(self) -> None:
+        """Test that missing codes are not turned into strings."""
+        assert WSTransactionInfo(info_type=None).info_type is None
+
+
+class TestResponseTotals:
+    """Tests for GetMCTransExtLocV2Response summary properties."""
+
+    def test_total_amount_skips_missing_totals(self) -> None:
+        """Test that missing net totals count as zero."""
+        response = GetMCTransExtLocV2Response.model_construct(
+            transactions=[
+                WSMCTransExtLocV2.model_construct(net_total=1.25),
+                WSMCTransExtLocV2.model_construct(net_total=None),
+            ]
+        )
+        assert response.total_amount == 1.25  # noqa: PLR2004
+        assert 'total_amount' not in response.model_dump()
+
+    def test_total_amount_tracks_transactions(self) -> None:
+        """Test that the total follows copies and appends to the transactions."""
+        response = GetMCTransExtLocV2Response.model_construct(
+            transactions=[WSMCTransExtLocV2.model_construct(net_total=5.0)]
+        )
+        assert response.total_amount == 5.0  # noqa: PLR2004
+        assert response.model_copy(update={'transactions': []}).total_amount == 0.0
+        response.transactions.append(WSMCTransExtLocV2.model_construct(net_total=2.5))
+        assert response.total_amount == 7.5  # noqa: PLR2004
+        assert 'total_amount=$7.50' in repr(response)
+
+
+class TestFleetMemoRecord:
+    """Tests for the slotted WSFleetMemo record."""
+
+    def test_validates_through_parent(self) -> None:
+        """Test that a nested fleet memo validates by alias and is slotted."""
+        transaction = WSMCTransExtLocV2.model_validate(
+            {'transaction_id': 1, 'fleetMemo': {'mercName': 'Depot', 'amount': '5'}}
+        )
+        memo = transaction.fleet_memo
+        assert isinstance(memo, WSFleetMemo)
+        assert memo.merc_name == 'Depot'
+        assert memo.amount == 5  # noqa: PLR2004
+        assert not hasattr(memo, '__dict__')
+
+
+class TestToDataframe:
+    """Tests for GetMCTransExtLocV2Response.to_dataframe on a parsed response."""
+
+    def test_one_row_per_line_item(self) -> None:
+        """Test that transactions expand to line-item rows with shared values."""
+        df = GetMCTransExtLocV2Response.from_soap_response(_TRANS_XML).to_dataframe()
+        assert df['transaction_id'].tolist() == [1001, 1001, 1002]
+        assert df['line_item_count'].tolist() == [2, 2, 0]
+        assert df['line_number'].tolist() == [1, 2, pd.NA]
+        assert df['card_number'].tolist() == [
+            '7083050000000001',
+            '7083050000000001',
+            '7083050000000002',
+        ]
+
+    def test_column_values(self) -> None:
+        """Test line-item, derived tax, info, and decoded fuel type values."""
+        df = GetMCTransExtLocV2Response.from_soap_response(_TRANS_XML).to_dataframe()
+        assert df['quantity'].tolist() == [50.5, 3.0, pd.NA]
+        assert df['fed_tax'].tolist() == [1.5, pd.NA, pd.NA]
+        assert df['state_fuel_tax'].tolist() == [2.5, pd.NA, pd.NA]
+        assert df['total_line_tax'].tolist() == [4.0, pd.NA, pd.NA]
+        assert df['unit'].tolist() == ['TRK1', 'TRK1', pd.NA]
+        assert df['odometer'].tolist() == [120345, 120345, pd.NA]
+        assert df['fuel_type_name'].tolist() == [FUEL_TYPE_MAP[2], pd.NA, pd.NA]
+        assert (
+            df['transaction_date'].tolist()[:2]
+            == [pd.Timestamp('2025-01-02 08:04:05', tz='UTC')] * 2
+        )
+        assert df['transaction_date'].isna().tolist() == [False, False, True]
+
+    def test_dtypes_and_column_order(self) -> None:
+        """Test that columns come out in schema order with schema dtypes."""
+        df = GetMCTransExtLocV2Response.from_soap_response(_TRANS_XML).to_dataframe()
+        assert tuple(df.columns) == ALL_COLUMNS
+        assert df['quantity'].dtype == pd.Float64Dtype()
+        assert df['location_latitude'].dtype == pd.Float64Dtype()
+        assert df['transaction_id'].dtype == pd.Int64Dtype()
+        assert df['odometer'].dtype == pd.Int64Dtype()
+        assert df['card_number'].dtype == pd.StringDtype()
+        assert df['fuel_type_name'].dtype == pd.StringDtype()
+        assert df['transaction_date'].dtype == pd.DatetimeTZDtype(
+            unit=_DATETIME_UNIT, tz='UTC'
+        )
+
+    def test_streaming_matches_tree_parse(self) -> None:
+        """Test that the streaming parser yields the same transactions and frame."""
+        tree_response = GetMCTransExtLocV2Response.from_soap_response(_TRANS_XML)
+        streamed_response = GetMCTransExtLocV2Response.from_soap_response_streaming(
+            _TRANS_XML.encode()
+        )
+        assert streamed_response.transactions == tree_response.transactions
+        pd.testing.assert_frame_equal(
+            streamed_response.to_dataframe(), tree_response.to_dataframe()
+        )
@@ -0,0 +1,130 @@
+"""Tests for transaction reject response helpers."""
+
+import logging
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+
+from fuelsync.response_models.trans_rejects_response import (
+    REJECT_ARROW_SCHEMA,
+    REJECT_FIELD_MAP,
+    GetTranRejectsResponse,
+    WSTranReject,
+)
+
+_REJECT_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+    <soapenv:Body>
+        <ns1:getTranRejectsResponse xmlns:ns1="http://ws.efs.com">
+            <result>
+                <value>
+                    <tranDate>2025-01-02T03:04:05-05:00</tranDate>
+                    <cardNum>1</cardNum>
+                    <errorCode>7</errorCode>
+                </value>
+                <value>
+                    <cardNum>2</cardNum>
+                    <locName>Depot</locName>
+                </value>
+            </result>
+        </ns1:getTranRejectsResponse>
+    </soapenv:Body>
+</soapenv:Envelope>"""
+
+
+class TestToDataframe:
+    """Tests for GetTranRejectsResponse.to_dataframe."""
+
+    def test_one_row_per_reject_in_field_map_order(self) -> None:
+        """Test that each reject becomes a row with every mapped column."""
+        response = GetTranRejectsResponse(
+            rejects=[
+                WSTranReject(
+                    tran_date=datetime(2025, 1, 2, tzinfo=UTC),
+                    card_num='123',
+                    error_code=7,
+                ),
+                WSTranReject(card_num='456', loc_name='Depot'),
+            ]
+        )
+        df = response.to_dataframe()
+        assert list(df.columns) == list(REJECT_FIELD_MAP.values())
+        assert df['card_num'].tolist() == ['123', '456']
+        assert df['loc_name'].isna().tolist() == [True, False]
+
+    def test_empty_response_keeps_columns(self) -> None:
+        """Test that an empty response still has the full column schema."""
+        df = GetTranRejectsResponse().to_dataframe()
+        assert df.empty
+        assert list(df.columns) == list(REJECT_FIELD_MAP.values())
+
+
+class TestToArrow:
+    """Tests for GetTranRejectsResponse.to_arrow."""
+
+    def test_dates_are_stored_as_utc(self) -> None:
+        """Test that offset datetimes are normalized to UTC timestamps."""
+        eastern = timezone(timedelta(hours=-5))
+        response = GetTranRejectsResponse(
+            rejects=[
+                WSTranReject(tran_date=datetime(2025, 1, 2, 3, tzinfo=eastern)),
+                WSTranReject(loc_id=12),
+            ]
+        )
+        table = response.to_arrow()
+        assert table.schema == REJECT_ARROW_SCHEMA
+        assert table.column('tran_date').to_pylist() == [
+            datetime(2025, 1, 2, 8, tzinfo=UTC),
+            None,
+        ]
+        assert table.column('loc_id').to_pylist() == [None, 12]
+
+    def test_empty_response(self) -> None:
+        """Test that an empty response gives an empty table with the schema."""
+        table = GetTranRejectsResponse().to_arrow()
+        assert table.num_rows == 0
+        assert table.schema == REJECT_ARROW_SCHEMA
+
+
+class TestFromSoapResponse:
+    """Tests for GetTranRejectsResponse parsing."""
+
+    def test_streaming_matches_tree_parse(self) -> None:
+        """Test that streaming parsing yields the same rejects."""
+        tree_response = GetTranRejectsResponse.from_soap_response(_REJECT_XML)
+        streamed_response = GetTranRejectsResponse.from_soap_response_streaming(
+            _REJECT_XML.encode()
+        )
+        assert [reject.card_num for reject in tree_response.rejects] == ['1', '2']
+        assert streamed_response.rejects == tree_response.rejects
+
+    def test_values_outside_result_are_ignored(self) -> None:
+        """Test that both paths only take <value> children of <result>."""
+        xml = _REJECT_XML.replace(
+            '<result>', '<other><value><cardNum>9</cardNum></value></other><result>'
+        )
+        tree_response = GetTranRejectsResponse.from_soap_response(xml)
+        streamed_response = GetTranRejectsResponse.from_soap_response_streaming(
+            xml.encode()
+        )
+        assert [reject.card_num for reject in tree_response.rejects] == ['1', '2']
+        assert streamed_response.rejects == tree_response.rejects
+
+    def test_invalid_reject_logs_readable_snippet(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that a failing reject is skipped and its XML logged unescaped."""
+        xml = """<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+    <soapenv:Body>
+        <response>
+            <result>
+                <value><cardNum>1</cardNum><errorCode>bad</errorCode></value>
+                <value><cardNum>2</cardNum><errorCode>7</errorCode></value>
+            </result>
+        </response>
+    </soapenv:Body>
+</soapenv:Envelope>"""
+        with caplog.at_level(logging.ERROR):
+            response = GetTranRejectsResponse.from_soap_response(xml)
+        assert [reject.card_num for reject in response.rejects] == ['2']
+        assert '\n  <errorCode>bad</errorCode>\n' in caplog.records[-1].getMessage()
@@ -0,0 +1,78 @@
+"""Tests for transaction summary response parsing."""
+
+import pytest
+
+from fuelsync.response_models.trans_summary_response import (
+    TransSummaryResponse,
+    WSTransSummary,
+)
+
+_SUMMARY_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+    <soapenv:Body>
+        <ns1:transSummaryResponse xmlns:ns1="http://ws.efs.com">
+            <result>
+                <tranCount>42</tranCount>
+                <tranTotal>1234.5</tranTotal>
+            </result>
+        </ns1:transSummaryResponse>
+    </soapenv:Body>
+</soapenv:Envelope>"""
+
+
+class TestFromSoapResponse:
+    """Tests for TransSummaryResponse parsing."""
+
+    def test_summary_fields_are_coerced(self) -> None:
+        """Test that the count and total are parsed into numbers."""
+        summary = TransSummaryResponse.from_soap_response(_SUMMARY_XML).summary
+        assert summary == WSTransSummary(tran_count=42, tran_total=1234.5)
+
+    def test_invalid_summary_raises_value_error(self) -> None:
+        """Test that a value failing validation raises ValueError."""
+        with pytest.raises(ValueError, match='Failed to parse transaction summary'):
+            TransSummaryResponse.from_soap_response(_SUMMARY_XML.replace('42', 'many'))
+
+    def test_streaming_matches_tree_parse(self) -> None:
+        """Test that streaming parsing yields the same summary."""
+        streamed = TransSummaryResponse.from_soap_response_streaming(
+            _SUMMARY_XML.encode()
+        )
+        assert streamed == TransSummaryResponse.from_soap_response(_SUMMARY_XML)
+
+    def test_streaming_without_result(self) -> None:
+        """Test that a body without <result> streams to an empty response."""
+        streamed = TransSummaryResponse.from_soap_response_streaming(
+            _SUMMARY_XML.replace('<result>', '<other>')
+            .replace('</result>', '</other>')
+            .encode()
+        )
+        assert streamed.summary is None
+
+
+class TestSummaryRecord:
+    """Tests for the WSTransSummary record type."""
+
+    def test_instances_are_slotted_and_frozen(self) -> None:
+        """Test that summaries have no instance dict and reject assignment."""
+        summary = WSTransSummary(tran_count=1, tran_total=2.0)
+        assert not hasattr(summary, '__dict__')
+        with pytest.raises(AttributeError):
+            summary.tran_count = 3  # pyright: ignore[reportAttributeAccessIssue]
+
+    def test_response_dump_includes_summary(self) -> None:
+        """Test that the containing response still serializes the summary."""
+        response = TransSummaryResponse.from_soap_response(_SUMMARY_XML)
+        assert response.model_dump() == {
+            'summary': {'tran_count': 42, 'tran_total': 1234.5}
+        }
+
+    def test_repr_formats_total(self) -> None:
+        """Test that repr shows the total as dollars."""
+        summary = WSTransSummary(tran_count=3, tran_total=12.5)
+        assert repr(summary) == 'WSTransSummary(count=3, total=$12.50)'
+
+    def test_repr_without_total(self) -> None:
+        """Test that repr works when the total is missing."""
+        response = TransSummaryResponse(summary=WSTransSummary(tran_count=0))
+        assert repr(response) == 'TransSummaryResponse(count=0, total=None)'
@@ -1,16 +1,31 @@
 """Tests for XML parsing utilities."""
 
+import logging
+
 import pytest
 from lxml import etree
 from lxml.etree import Element
 
 from fuelsync.utils.xml_parser import (
+    XP_RESULT_VALUES,
+    LazyXmlSnippet,
     check_for_soap_fault,
     extract_soap_body,
+    find_soap_result,
+    iter_soap_result_values,
     parse_soap_response,
+    stream_soap_result,
 )
 
 
+def _wrap_body(content: bytes) -> bytes:
+    """Wrap body content in a minimal SOAP envelope."""
+    return (
+        b'<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">'
+        b'<soapenv:Body>' + content + b'</soapenv:Body></soapenv:Envelope>'
+    )
+
+
 class TestParseSoapResponse:
     """Tests for parse_soap_response function."""
 
@@ -26,6 +41,17 @@ class TestParseSoapResponse:
         assert root is not None
         assert isinstance(root, Element)
 
+    def test_parse_bytes(self) -> None:
+        """Test that a bytes response is parsed without re-encoding."""
+        root: Element = parse_soap_response('<r><a>é</a></r>'.encode())
+        assert root.findtext('a') == 'é'
+
+    def test_blank_text_is_dropped(self) -> None:
+        """Test that whitespace-only text between elements is not kept."""
+        root: Element = parse_soap_response('<r>\n  <a>1</a>\n</r>')
+        assert root.text is None
+        assert root[0].tail is None
+
     def test_parse_malformed_xml_raises_error(self) -> None:
         """Test that malformed XML raises XMLSyntaxError."""
         xml = '<invalid><xml>'
@@ -54,6 +80,16 @@ class TestExtractSoapBody:
         assert body is not None
         assert body.tag.endswith('Body')  # pyright: ignore[reportArgumentType, reportAttributeAccessIssue]
 
+    def test_extract_nested_body(self) -> None:
+        """Test that a Body below a wrapper element is still found."""
+        xml = """<wrapper>
+<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+    <soapenv:Body><response>Success</response></soapenv:Body>
+</soapenv:Envelope>
+</wrapper>"""
+        body: Element = extract_soap_body(parse_soap_response(xml))
+        assert body.findtext('response') == 'Success'
+
     def test_extract_body_raises_error_when_missing(self) -> None:
         """Test that missing Body element raises ValueError."""
         xml = """<?xml version="1.0" encoding="UTF-8"?>
@@ -97,6 +133,30 @@ class TestCheckForSoapFault:
         ):
             check_for_soap_fault(root)
 
+    def test_fault_detected_from_body(self) -> None:
+        """Test that the Body element can be checked directly."""
+        xml = """<wrapper>
+<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+    <soapenv:Body>
+        <soapenv:Fault><faultcode>Client</faultcode></soapenv:Fault>
+    </soapenv:Body>
+</soapenv:Envelope>
+</wrapper>"""
+        with pytest.raises(RuntimeError, match=r'SOAP Fault \[Client\]'):
+            check_for_soap_fault(extract_soap_body(parse_soap_response(xml)))
+
+    def test_fault_detected_in_nested_body(self) -> None:
+        """Test that a Body below the root is found the same way as extraction."""
+        xml = """<wrapper>
+<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+    <soapenv:Body>
+        <soapenv:Fault><faultcode>Client</faultcode></soapenv:Fault>
+    </soapenv:Body>
+</soapenv:Envelope>
+</wrapper>"""
+        with pytest.raises(RuntimeError, match=r'SOAP Fault \[Client\]'):
+            check_for_soap_fault(parse_soap_response(xml))
+
     def test_fault_with_missing_faultcode(self) -> None:
         """Test handling SOAP fault with missing faultcode."""
         xml = """<?xml version="1.0" encoding="UTF-8"?>
@@ -126,3 +186,200 @@ class TestCheckForSoapFault:
         root: Element = parse_soap_response(xml)
         with pytest.raises(RuntimeError, match=r'SOAP Fault.*Client.*Unknown error'):
             check_for_soap_fault(root)
+
+
+class TestFindSoapResult:
+    """Tests for find_soap_result function."""
+
+    def test_finds_result_under_operation_response(self) -> None:
+        """Test that the usual Body -> response -> result shape is found."""
+        body = etree.fromstring(
+            '<Body><response><result><value>1</value></result></response></Body>'
+        )
+        result_element = find_soap_result(body)
+        assert result_element is not None
+        assert result_element.findtext('value') == '1'
+
+    def test_falls_back_to_nested_result(self) -> None:
+        """Test that a deeper <result> is still found."""
+        body = etree.fromstring('<Body><a><b><result>x</result></b></a></Body>')
+        result_element = find_soap_result(body)
+        assert result_element is not None
+        assert result_element.text == 'x'
+
+    def test_missing_result_returns_none(self) -> None:
+        """Test that a body without <result> gives None."""
+        assert find_soap_result(etree.fromstring('<Body><response/></Body>')) is None
+
+
+class TestIterSoapResultValues:
+    """Tests for iter_soap_result_values function."""
+
+    def test_yields_only_result_values(self) -> None:
+        """Test that nested <value> elements inside records are not yielded."""
+        xml = b"""<?xml version="1.0" encoding="UTF-8"?>
+<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+    <soapenv:Body>
+        <response>
+            <result>
+                <value><id>1</id><infos><value>nested</value></infos></value>
+                <value><id>2</id></value>
+            </result>
+        </response>
+    </soapenv:Body>
+</soapenv:Envelope>"""
+        ids = [element.findtext('id') for element in iter_soap_result_values(xml)]
+        assert ids == ['1', '2']
+
+    def test_processed_values_are_released(self) -> None:
+        """Test that earlier records are removed from the tree while streaming."""
+        xml = _wrap_body(
+            b'<result><value>1</value><value>2</value><value>3</value></result>'
+        )
+        result_elements = {
+            element.getparent() for element in iter_soap_result_values(xml)
+        }
+        (result_element,) = result_elements
+        assert len(result_element) == 1
+        assert result_element[0].text is None
+
+    def test_fault_raises_runtime_error(self) -> None:
+        """Test that a SOAP fault raises RuntimeError while streaming."""
+        xml = b"""<?xml version="1.0" encoding="UTF-8"?>
+<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+    <soapenv:Body>
+        <soapenv:Fault>
+            <faultcode>soapenv:Server</faultcode>
+            <faultstring>Invalid credentials</faultstring>
+        </soapenv:Fault>
+    </soapenv:Body>
+</soapenv:Envelope>"""
+        with pytest.raises(
+            RuntimeError, match=r'SOAP Fault.*Server.*Invalid credentials'
+        ):
+            list(iter_soap_result_values(xml))
+
+    def test_missing_body_raises_value_error(self) -> None:
+        """Test that a response without a Body raises like extract_soap_body."""
+        xml = b'<r><result><value>1</value></result></r>'
+        with pytest.raises(ValueError, match='No SOAP Body'):
+            list(iter_soap_result_values(xml))
+
+    def test_missing_result_logs_warning(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that a Body without <result> warns and yields nothing."""
+        with caplog.at_level(logging.WARNING):
+            values = list(iter_soap_result_values(_wrap_body(b'<response/>')))
+        assert values == []
+        assert 'No <result> element' in caplog.text
+
+    def test_empty_result_logs_warning(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that a <result> without <value> records warns and yields nothing."""
+        with caplog.at_level(logging.WARNING):
+            values = list(iter_soap_result_values(_wrap_body(b'<result/>')))
+        assert values == []
+        assert 'No <value> elements' in caplog.text
+
+
+class TestStreamSoapResult:
+    """Tests for stream_soap_result function."""
+
+    def test_returns_first_result(self) -> None:
+        """Test that the completed <result> element is returned."""
+        xml = _wrap_body(b'<result><tranCount>3</tranCount></result>')
+        result_element = stream_soap_result(xml)
+        assert result_element is not None
+        assert result_element.findtext('tranCount') == '3'
+
+    def test_missing_result_returns_none(self) -> None:
+        """Test that a response without <result> gives None."""
+        assert stream_soap_result(_wrap_body(b'<response/>')) is None
+
+    def test_missing_body_raises_value_error(self) -> None:
+        """Test that a <result> outside any Body raises like extract_soap_body."""
+        with pytest.raises(ValueError, match='No SOAP Body'):
+            stream_soap_result(b'<r><result><tranCount>3</tranCount></result></r>')
+
+    def test_fault_raises_runtime_error(self) -> None:
+        """Test that a SOAP fault raises RuntimeError."""
+        xml = b"""<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+    <soapenv:Body>
+        <soapenv:Fault>
+            <faultcode>soapenv:Server</faultcode>
+            <faultstring>Invalid credentials</faultstring>
+        </soapenv:Fault>
+    </soapenv:Body>
+</soapenv:Envelope>"""
+        with pytest.raises(
+            RuntimeError, match=r'SOAP Fault.*Server.*Invalid credentials'
+        ):
+            stream_soap_result(xml)
+
+
+_ENTITY_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE soapenv:Envelope [<!ENTITY site "Depot">]>
+<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+    <soapenv:Body>
+        <response>
+            <result>
+                <value>
+                    <id>1</id>
+                    <name>&site; North</name>
+                </value>
+                <value>
+                    <id>2</id>
+                    <name>Plain</name>
+                </value>
+            </result>
+        </response>
+    </soapenv:Body>
+</soapenv:Envelope>"""
+
+
+class TestStreamingMatchesTreeParse:
+    """Tests that streaming and tree parsing see the same document."""
+
+    def test_result_values_match(self) -> None:
+        """Test that entities and blank text are handled alike on both paths."""
+        body: Element = extract_soap_body(parse_soap_response(_ENTITY_XML))
+        result_element = find_soap_result(body)
+        assert result_element is not None
+        tree_values = [etree.tostring(v) for v in XP_RESULT_VALUES(result_element)]
+        streamed_values = [
+            etree.tostring(v) for v in iter_soap_result_values(_ENTITY_XML)
+        ]
+        assert streamed_values == tree_values
+        assert b'&site;' in tree_values[0]
+
+    def test_result_element_matches(self) -> None:
+        """Test that stream_soap_result returns the same <result> as the tree."""
+        body: Element = extract_soap_body(parse_soap_response(_ENTITY_XML))
+        tree_result = find_soap_result(body)
+        streamed_result = stream_soap_result(_ENTITY_XML)
+        assert tree_result is not None
+        assert streamed_result is not None
+        assert etree.tostring(streamed_result) == etree.tostring(tree_result)
+
+
+class TestLazyXmlSnippet:
+    """Tests for LazyXmlSnippet."""
+
+    def test_str_pretty_prints_element(self) -> None:
+        """Test that str() renders the element as pretty-printed XML."""
+        element = etree.fromstring('<value><id>1</id></value>')
+        assert str(LazyXmlSnippet(element)) == '<value>\n  <id>1</id>\n</value>\n'
+
+    def test_not_rendered_when_level_disabled(self) -> None:
+        """Test that a filtered-out log record never serializes the element."""
+        rendered: list[bool] = []
+
+        class _Probe(LazyXmlSnippet):
+            def __str__(self) -> str:
+                rendered.append(True)
+                return super().__str__()
+
+        logger = logging.getLogger('fuelsync.tests.lazy_xml')
+        logger.setLevel(logging.CRITICAL)
+        logger.error('%s', _Probe(etree.fromstring('<value/>')))
+        assert not rendered